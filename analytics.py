@@ -0,0 +1,60 @@
+import numpy as np                  # Import NumPy for vectorized statistics
+from timing import schedule_masks, schedule_times   # Service order with request/wrap masks
+from instrument import phase        # Opt-in phase timers
+
+# Percentiles reported for every algorithm
+PERCENTILES = (50, 95, 99)
+
+
+def request_waits(requests, start, direction, max_cylinder, algorithm, model=None, result=None):
+    # Per-request wait until service, with every request present at time 0. Without a model
+    # the wait is the head travel (cylinders) before the request is reached; with a
+    # timing.DiskModel it is the completion time in ms.
+    # An already computed ScheduleResult may be passed to avoid rerunning the algorithm.
+    # Returns (cylinders in service order, waits).
+    sequence, is_request, is_wrap = schedule_masks(requests, start, direction, max_cylinder, algorithm, result)
+    if model is not None:
+        waits, _ = schedule_times(sequence, start, model, is_request, is_wrap)
+    else:
+        waits = np.cumsum(np.abs(np.diff(sequence, prepend=start)))[is_request]
+    return sequence[is_request], waits
+
+
+def wait_stats(waits):
+    # Distribution summary of the waits: percentiles, max, mean and variance
+    waits = np.asarray(waits, dtype=np.float64)
+    if not waits.size:
+        return {**{f"p{p}": 0.0 for p in PERCENTILES}, "max": 0.0, "mean": 0.0, "variance": 0.0}
+    stats = {f"p{p}": float(v) for p, v in zip(PERCENTILES, np.percentile(waits, PERCENTILES))}
+    stats.update(max=float(waits.max()), mean=float(waits.mean()), variance=float(waits.var()))
+    return stats
+
+
+def band_fairness(cylinders, waits, max_cylinder, bands=10):
+    # Mean wait per cylinder band plus Jain's fairness index across the non-empty bands
+    # (1.0 means every band waits equally long on average)
+    cylinders = np.asarray(cylinders, dtype=np.int64)
+    band = np.minimum(cylinders * bands // (max_cylinder + 1), bands - 1)
+    counts = np.bincount(band, minlength=bands)
+    totals = np.bincount(band, weights=waits, minlength=bands)
+    means = np.divide(totals, counts, out=np.zeros(bands), where=counts > 0)
+    used = means[counts > 0]
+    jain = float(used.sum() ** 2 / (used.size * (used ** 2).sum())) if used.size and used.any() else 1.0
+    return {
+        "edges": np.linspace(0, max_cylinder + 1, bands + 1),
+        "counts": counts,
+        "mean_wait": means,
+        "jain_index": jain,
+    }
+
+
+def analyze(requests, start, direction, max_cylinder, algorithm, model=None, bands=10, result=None):
+    # Full response-time report for one algorithm: per-request waits, summary stats and fairness
+    with phase("compute.analytics"):
+        cylinders, waits = request_waits(requests, start, direction, max_cylinder, algorithm, model, result)
+        return {
+            "cylinders": cylinders,
+            "waits": waits,
+            "stats": wait_stats(waits),
+            "fairness": band_fairness(cylinders, waits, max_cylinder, bands),
+        }
@@ -0,0 +1,145 @@
+import numpy as np                  # Import NumPy for the vectorized engine
+
+# Algorithms supported by the vectorized engine, in the order the UI shows them
+ALGORITHMS = ("SCAN", "C-SCAN", "LOOK", "C-LOOK")
+
+
+def _as_array(requests):
+    # Convert any request container (list, tuple, array, memmap) to an int64 array
+    return np.asarray(requests, dtype=np.int64)
+
+
+def _marker(value):
+    # One-element array used for end-of-disk / wrap-around stops
+    return np.array([value], dtype=np.int64)
+
+
+def service_segments(ordered, start, direction, max_cylinder, algorithm):
+    # Splits sorted requests around start and returns the service order as a list of
+    # (array, is_request) pieces. Reversed pieces are views, so nothing is copied here.
+    if direction == 'right':
+        split = int(np.searchsorted(ordered, start, side='left'))   # Requests >= start go right
+        right = ordered[split:]
+        left = ordered[:split]
+        current = int(right[-1]) if right.size else start           # Head position after the first sweep
+        segments = [(right, True)]
+        if algorithm == "SCAN":
+            if current != max_cylinder:
+                segments.append((_marker(max_cylinder), False))     # Run to the end of the disk
+            segments.append((left[::-1], True))                     # Sweep back down
+        elif algorithm == "C-SCAN":
+            if current != max_cylinder:
+                segments.append((_marker(max_cylinder), False))     # Run to the end of the disk
+            if left.size:
+                segments.append((_marker(0), False))                # Wrap around to cylinder 0
+                segments.append((left, True))                       # Sweep up again
+        elif algorithm == "LOOK":
+            segments.append((left[::-1], True))                     # Reverse at the last request
+        else:
+            segments.append((left, True))                           # Jump to the lowest request
+    else:
+        split = int(np.searchsorted(ordered, start, side='right'))  # Requests <= start go left
+        left = ordered[:split][::-1]
+        right = ordered[split:]
+        current = int(left[-1]) if left.size else start
+        segments = [(left, True)]
+        if algorithm == "SCAN":
+            if current != 0:
+                segments.append((_marker(0), False))                # Run to the start of the disk
+            segments.append((right, True))                          # Sweep back up
+        elif algorithm == "C-SCAN":
+            if current != 0:
+                segments.append((_marker(0), False))                # Run to the start of the disk
+            if right.size:
+                segments.append((_marker(max_cylinder), False))     # Wrap around to the max cylinder
+                segments.append((right[::-1], True))                # Sweep down again
+        elif algorithm == "LOOK":
+            segments.append((right, True))                          # Reverse at the last request
+        else:
+            segments.append((right[::-1], True))                    # Jump to the highest request
+    return segments
+
+
+def _movement(sequence, start):
+    # Total head movement along start -> sequence[0] -> sequence[1] -> ...
+    if not sequence.size:
+        return 0
+    return int(abs(int(sequence[0]) - start) + np.abs(np.diff(sequence)).sum())
+
+
+def _schedule_sorted(ordered, start, direction, max_cylinder, algorithm):
+    # Builds the service order and total movement from already sorted requests
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    pieces = [values for values, _ in service_segments(ordered, start, direction, max_cylinder, algorithm)]
+    sequence = np.concatenate(pieces)
+    return sequence, _movement(sequence, start)
+
+
+def schedule_array(requests, start, direction, max_cylinder, algorithm):
+    # Vectorized equivalent of run_scan / run_cscan / run_look / run_clook.
+    # Returns (sequence as an int64 array, total movement).
+    ordered = np.sort(_as_array(requests))
+    return _schedule_sorted(ordered, int(start), direction, int(max_cylinder), algorithm)
+
+
+def schedule_all_array(requests, start, direction, max_cylinder):
+    # Runs every algorithm from a single sort of the request array.
+    # Returns a dict mapping algorithm name to (sequence array, movement).
+    ordered = np.sort(_as_array(requests))
+    return {
+        algorithm: _schedule_sorted(ordered, int(start), direction, int(max_cylinder), algorithm)
+        for algorithm in ALGORITHMS
+    }
+
+
+def _per_row(value, rows):
+    # Broadcasts a scalar parameter to one value per row
+    if np.ndim(value) == 0:
+        return [value] * rows
+    if len(value) != rows:
+        raise ValueError("Per-row parameters must have one value per request set")
+    return list(value)
+
+
+def schedule_batch(batch, start, direction, max_cylinder, algorithm):
+    # Runs one algorithm over a 2-D batch of request sets (one set per row).
+    # start, direction and max_cylinder may be scalars or one value per row.
+    # Returns (list of sequence arrays, int64 array of movements).
+    batch = _as_array(batch)
+    if batch.ndim != 2:
+        raise ValueError("Batch must be a 2-D array of request sets")
+    ordered = np.sort(batch, axis=1)                                # Sort every row in one call
+    rows = ordered.shape[0]
+    starts = _per_row(start, rows)
+    directions = _per_row(direction, rows)
+    max_cylinders = _per_row(max_cylinder, rows)
+
+    sequences = []
+    movements = np.empty(rows, dtype=np.int64)
+    for i in range(rows):
+        sequence, movements[i] = _schedule_sorted(
+            ordered[i], int(starts[i]), directions[i], int(max_cylinders[i]), algorithm
+        )
+        sequences.append(sequence)
+    return sequences, movements
+
+
+def vector_scan(requests, start, direction, max_cylinder):
+    # Same signature and results as run_scan, backed by NumPy
+    return schedule_array(requests, start, direction, max_cylinder, "SCAN")
+
+
+def vector_cscan(requests, start, direction, max_cylinder):
+    # Same signature and results as run_cscan, backed by NumPy
+    return schedule_array(requests, start, direction, max_cylinder, "C-SCAN")
+
+
+def vector_look(requests, start, direction):
+    # Same signature and results as run_look, backed by NumPy (max_cylinder is unused)
+    return schedule_array(requests, start, direction, 0, "LOOK")
+
+
+def vector_clook(requests, start, direction, max_cylinder):
+    # Same signature and results as run_clook, backed by NumPy
+    return schedule_array(requests, start, direction, max_cylinder, "C-LOOK")
@@ -0,0 +1,180 @@
+import argparse                     # Import argparse for the command-line interface
+import json                         # Import json for machine-readable results
+import platform                     # Import platform to record the machine in the report
+import sys                          # Import sys for the exit status
+import time                         # Import time for the report timestamp
+import timeit                       # Import timeit for auto-ranged wall-clock measurements
+import tracemalloc                  # Import tracemalloc for peak memory
+import numpy as np                  # Import NumPy for workload generation
+from scan import run_scan           # Reference SCAN implementation
+from cscan import run_cscan         # Reference C-SCAN implementation
+from look import run_look           # Reference LOOK implementation
+from clook import run_clook         # Reference C-LOOK implementation
+from result import schedule_all     # ScheduleResults used by "Compare All" in the UI
+from batch import schedule_array, schedule_all_array    # Vectorized engine
+from movement import movement_only, movements_only      # Closed-form movement
+
+ALGORITHMS = ("SCAN", "C-SCAN", "LOOK", "C-LOOK")
+DISTRIBUTIONS = ("uniform", "zipf", "sequential", "clustered")
+DEFAULT_SIZES = [10 ** k for k in range(1, 8)]
+
+# Pure-Python reference implementations, keyed by algorithm
+REFERENCE = {
+    "SCAN": lambda requests, start, direction, max_cylinder: run_scan(requests, start, direction, max_cylinder),
+    "C-SCAN": lambda requests, start, direction, max_cylinder: run_cscan(requests, start, direction, max_cylinder),
+    "LOOK": lambda requests, start, direction, max_cylinder: run_look(requests, start, direction),
+    "C-LOOK": lambda requests, start, direction, max_cylinder: run_clook(requests, start, direction, max_cylinder),
+}
+
+# Engines benchmarked per algorithm: name -> (runner, takes a Python list, pure Python)
+ENGINES = {
+    "reference": (lambda algo, r, s, d, m: REFERENCE[algo](r, s, d, m), True, True),
+    "vectorized": (lambda algo, r, s, d, m: schedule_array(r, s, d, m, algo), False, False),
+    "movement_only": (lambda algo, r, s, d, m: movement_only(r, s, d, m, algo), False, False),
+}
+
+# Engines benchmarked for the "Compare All" path (all four algorithms at once)
+COMPARE_ENGINES = {
+    "compare_reference": (lambda r, s, d, m: [REFERENCE[a](r, s, d, m) for a in ALGORITHMS], True, True),
+    "compare_results": (lambda r, s, d, m: schedule_all(r, s, d, m, ALGORITHMS), False, False),
+    "compare_vectorized": (lambda r, s, d, m: schedule_all_array(r, s, d, m), False, False),
+    "compare_movement_only": (lambda r, s, d, m: movements_only(r, s, d, m), False, False),
+}
+
+
+def make_requests(distribution, size, max_cylinder, start, rng):
+    # Generates a synthetic request set of the given distribution as an int64 array
+    if distribution == "uniform":
+        return rng.integers(0, max_cylinder + 1, size)
+    if distribution == "zipf":
+        # A few hot cylinders receive most of the traffic
+        hot = rng.integers(0, max_cylinder + 1, 64)
+        return hot[(rng.zipf(1.5, size) - 1) % hot.size]
+    if distribution == "sequential":
+        # Runs of consecutive cylinders starting at random positions
+        lengths = rng.geometric(1 / 64, size)
+        lengths = lengths[:np.searchsorted(np.cumsum(lengths), size) + 1]
+        run_starts = rng.integers(0, max_cylinder + 1, lengths.size)
+        offsets = np.arange(size) - np.repeat(np.cumsum(lengths) - lengths, lengths)[:size]
+        return np.minimum(np.repeat(run_starts, lengths)[:size] + offsets, max_cylinder)
+    if distribution == "clustered":
+        # Requests concentrated around the initial head position
+        spread = max(1.0, max_cylinder * 0.02)
+        return np.clip(np.rint(rng.normal(start, spread, size)), 0, max_cylinder).astype(np.int64)
+    raise ValueError(f"Unknown distribution: {distribution}")
+
+
+def measure(func, repeat):
+    # Per-call wall time: timeit picks a loop count filling at least 0.2 s, so fast cases are
+    # not timed from a single noisy call, and the best of `repeat` such loops is kept.
+    # One extra run under tracemalloc gives peak memory.
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat, number)) / number
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def run_benchmarks(sizes, distributions, max_cylinder, start, direction, repeat, reference_limit, seed):
+    # Runs every engine over every size and distribution; returns a list of result records
+    results = []
+    rng = np.random.default_rng(seed)
+    for distribution in distributions:
+        for size in sizes:
+            array = make_requests(distribution, size, max_cylinder, start, rng).astype(np.int64)
+            as_list = array.tolist()
+            jobs = [(name, algo, runner, takes_list, pure)
+                    for name, (runner, takes_list, pure) in ENGINES.items() for algo in ALGORITHMS]
+            jobs += [(name, "ALL", runner, takes_list, pure)
+                     for name, (runner, takes_list, pure) in COMPARE_ENGINES.items()]
+            for name, algo, runner, takes_list, pure in jobs:
+                if pure and size > reference_limit:
+                    continue                                # Pure Python is too slow at this size
+                requests = as_list if takes_list else array
+                if algo == "ALL":
+                    call = lambda: runner(requests, start, direction, max_cylinder)
+                else:
+                    call = lambda: runner(algo, requests, start, direction, max_cylinder)
+                seconds, peak = measure(call, repeat)
+                results.append({
+                    "engine": name,
+                    "algorithm": algo,
+                    "distribution": distribution,
+                    "size": size,
+                    "seconds": seconds,
+                    "ns_per_request": seconds * 1e9 / size,
+                    "peak_bytes": peak,
+                })
+                print(f"{name:>22} {algo:>6} {distribution:>10} {size:>9} "
+                      f"{seconds * 1e9 / size:10.1f} ns/req {peak / 1e6:9.2f} MB", flush=True)
+    return results
+
+
+def compare_to_baseline(results, baseline, tolerance, min_delta=0.0):
+    # Returns records whose time grew by more than `tolerance` (a fraction) over the baseline
+    # and by more than `min_delta` seconds, so microsecond-scale jitter never fails the gate
+    previous = {(r["engine"], r["algorithm"], r["distribution"], r["size"]): r for r in baseline["results"]}
+    regressions = []
+    for r in results:
+        old = previous.get((r["engine"], r["algorithm"], r["distribution"], r["size"]))
+        if old and r["seconds"] > old["seconds"] * (1 + tolerance) and r["seconds"] - old["seconds"] > min_delta:
+            regressions.append({**r, "baseline_seconds": old["seconds"], "ratio": r["seconds"] / old["seconds"]})
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the disk scheduling algorithms.")
+    parser.add_argument("--sizes", type=lambda v: [int(float(x)) for x in v.split(",")], default=DEFAULT_SIZES,
+                        help="Comma-separated request counts (default: 10 to 1e7)")
+    parser.add_argument("--distributions", type=lambda v: v.split(","), default=list(DISTRIBUTIONS),
+                        help="Comma-separated subset of: " + ", ".join(DISTRIBUTIONS))
+    parser.add_argument("--max-cylinder", type=int, default=9999)
+    parser.add_argument("--start", type=int, default=5000)
+    parser.add_argument("--direction", choices=("right", "left"), default="right")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Auto-ranged timing loops per case; the best is kept")
+    parser.add_argument("--reference-limit", type=int, default=10 ** 6,
+                        help="Largest size run through the pure-Python implementations")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="Write results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON file from a previous run to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed slowdown against the baseline before failing (default: 20%%)")
+    parser.add_argument("--min-delta", type=float, default=0.01,
+                        help="Slowdowns below this many ms per call never fail (default: 0.01)")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        args.sizes, args.distributions, args.max_cylinder, args.start, args.direction,
+        args.repeat, args.reference_limit, args.seed
+    )
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "args": {k: v for k, v in vars(args).items() if k not in ("out", "baseline")},
+        },
+        "results": results,
+    }
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare_to_baseline(results, json.load(f), args.tolerance, args.min_delta / 1000.0)
+        for r in regressions:
+            print(f"REGRESSION {r['engine']} {r['algorithm']} {r['distribution']} {r['size']}: "
+                  f"{r['baseline_seconds']:.4g}s -> {r['seconds']:.4g}s ({r['ratio']:.2f}x)")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
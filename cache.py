@@ -0,0 +1,106 @@
+import hashlib                      # Import hashlib to fingerprint request sets
+import threading                    # Import threading so concurrent sessions can share a cache
+from collections import OrderedDict # Import OrderedDict to track least recently used entries
+import numpy as np                  # Import NumPy to hash request arrays without Python loops
+
+
+def make_key(requests, start, direction, max_cylinder, algorithm):
+    # Stable hash of a simulation's inputs; requests are hashed as raw int64 bytes
+    digest = hashlib.blake2b(np.asarray(requests, dtype=np.int64).tobytes(), digest_size=16)
+    digest.update(f"|{start}|{direction}|{max_cylinder}|{algorithm}".encode())
+    return digest.hexdigest()
+
+
+def schedule_size(value):
+    # Approximate memory held by a schedule result: the buffer size of arrays and
+    # ScheduleResults, otherwise 8 bytes per stored cylinder
+    if hasattr(value, "nbytes"):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sum(schedule_size(v) for v in value.values())
+    if isinstance(value, tuple):
+        return sum(schedule_size(v) for v in value)
+    if hasattr(value, "__len__"):
+        return 8 * len(value)
+    return 8
+
+
+class LRUCache:
+    # Bounded least-recently-used cache. Entries are evicted once either the entry count or
+    # the total estimated size (via `sizeof`) exceeds its limit.
+
+    def __init__(self, max_entries=64, max_bytes=None, sizeof=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof or (lambda value: 0)
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()   # key -> (value, size), oldest first
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        # Returns the cached value and marks it as most recently used
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key][0]
+
+    def put(self, key, value):
+        # Stores a value, then evicts least recently used entries until within limits
+        size = self.sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_entries
+                or (self.max_bytes is not None and self._bytes > self.max_bytes)
+            ):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+
+    def evict(self, key):
+        # Removes one entry if present
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+
+    def clear(self):
+        # Removes every entry and resets the statistics
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        # Snapshot of cache usage for display or monitoring
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def get_or_compute(self, key, compute):
+        # Returns the cached value for key, computing and storing it on a miss
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+
+# Sentinel distinguishing "not cached" from a cached None
+_MISSING = object()
@@ -0,0 +1,132 @@
+import argparse                     # Import argparse for the command-line interface
+import csv                          # Import csv for CSV output
+import json                         # Import json for JSON output
+import re                           # Import re to split request lists on commas/whitespace
+import sys                          # Import sys for stdin/stdout
+from registry import names, run     # Import the algorithm registry (pure Python, no NumPy)
+
+# Heavy modules (NumPy, trace loading, the vectorized engine) are imported inside the
+# functions that need them so a plain text run starts in milliseconds.
+
+
+def validate(requests, max_cylinder):
+    # Same checks as the UI, in plain Python
+    if requests and min(requests) < 0:
+        raise ValueError("Negative values in disk requests!")
+    if requests and max(requests) > max_cylinder:
+        raise ValueError(f"One or more disk requests exceed the maximum cylinder value ({max_cylinder})")
+
+
+def read_requests(source, fmt, max_cylinder, geometry=None, skip_header=False):
+    # Reads and validates requests from a path or "-" (stdin). Plain text is parsed into a
+    # list without NumPy; CSV, blkparse and binary traces go through traces.py and come back
+    # as an int64 array.
+    if fmt == "text":
+        text = sys.stdin.read() if source == "-" else open(source).read()
+        if skip_header:
+            text = text.partition("\n")[2]             # Drop the header line
+        requests = [int(token) for token in re.split(r"[,\s]+", text.strip()) if token]
+        if geometry:
+            heads, sectors_per_track = geometry
+            requests = [sector // (heads * sectors_per_track) for sector in requests]
+        validate(requests, max_cylinder)
+        return requests
+    from traces import Geometry, load_trace     # Lazy: pulls in NumPy
+    return load_trace(
+        sys.stdin.buffer if source == "-" else source, max_cylinder,
+        fmt="binary" if fmt.startswith("binary") else fmt,
+        geometry=Geometry(*geometry) if geometry else None,
+        dtype="int32" if fmt == "binary32" else "int64",
+        skip_header=skip_header
+    )
+
+
+def schedule(requests, algorithms, start, direction, max_cylinder, engine, movement_only):
+    # Runs the chosen algorithms and returns {name: (sequence or None, movement)}
+    if movement_only:
+        from movement import movements_only     # Lazy: closed-form totals, no sequences
+        totals = movements_only(requests, start, direction, max_cylinder)
+        return {name: (None, totals[name]) for name in algorithms}
+    if engine == "vectorized":
+        from batch import schedule_array        # Lazy: NumPy engine for the SCAN family
+        return {name: tuple(schedule_array(requests, start, direction, max_cylinder, name)) for name in algorithms}
+    if not isinstance(requests, list):
+        requests = requests.tolist()            # The pure-Python algorithms work on lists
+    if len(algorithms) > 1:
+        from compare import run_registered      # Shared single-sort kernel
+        results = run_registered(requests, start, direction, max_cylinder)
+        return {name: results[name] for name in algorithms}
+    return {name: run(name, requests, start, direction, max_cylinder) for name in algorithms}
+
+
+def write_results(results, args, out):
+    # Writes one record per algorithm as JSON or CSV
+    records = [{
+        "algorithm": name,
+        "start": args.start,
+        "direction": args.direction,
+        "max_cylinder": args.max_cylinder,
+        "movement": int(movement),
+        **({"sequence": [int(c) for c in sequence]} if sequence is not None and not args.no_sequence else {}),
+    } for name, (sequence, movement) in results.items()]
+    if args.output_format == "json":
+        json.dump(records if len(records) > 1 else records[0], out)
+        out.write("\n")
+        return
+    fields = ["algorithm", "start", "direction", "max_cylinder", "movement"]
+    if any("sequence" in r for r in records):
+        fields.append("sequence")
+    writer = csv.DictWriter(out, fieldnames=fields, lineterminator="\n")
+    writer.writeheader()
+    for r in records:
+        if "sequence" in r:
+            r["sequence"] = " ".join(map(str, r["sequence"]))
+        writer.writerow(r)
+
+
+def main(argv=None):
+    registered = names()
+    parser = argparse.ArgumentParser(description="Run disk scheduling algorithms without the web UI.")
+    parser.add_argument("input", nargs="?", default="-", help="Request file, or - for stdin (default)")
+    parser.add_argument("-a", "--algorithm", default="all", choices=registered + ["all"],
+                        help="Algorithm to run (default: all)")
+    parser.add_argument("-s", "--start", type=int, required=True, help="Initial head position")
+    parser.add_argument("-d", "--direction", choices=("right", "left"), default="right")
+    parser.add_argument("-m", "--max-cylinder", type=int, required=True, help="Highest cylinder number")
+    parser.add_argument("-i", "--input-format", default="text",
+                        choices=("text", "csv", "blkparse", "binary32", "binary64"),
+                        help="text: comma/whitespace separated integers (default)")
+    parser.add_argument("--geometry", type=int, nargs=2, metavar=("HEADS", "SECTORS_PER_TRACK"),
+                        help="Map sector/LBA values to cylinders")
+    parser.add_argument("--skip-header", action="store_true",
+                        help="Ignore the first line of a text or CSV input")
+    parser.add_argument("-f", "--output-format", choices=("json", "csv"), default="json")
+    parser.add_argument("--engine", choices=("python", "vectorized"), default="python",
+                        help="vectorized uses the NumPy engine (SCAN, C-SCAN, LOOK, C-LOOK only)")
+    parser.add_argument("--movement-only", action="store_true",
+                        help="Only compute total movement (SCAN, C-SCAN, LOOK, C-LOOK only)")
+    parser.add_argument("--no-sequence", action="store_true", help="Omit the service sequence from the output")
+    args = parser.parse_args(argv)
+
+    if not 0 <= args.start <= args.max_cylinder:
+        parser.error(f"Initial head position must be between 0 and {args.max_cylinder}")
+
+    algorithms = registered if args.algorithm == "all" else [args.algorithm]
+    if args.engine == "vectorized" or args.movement_only:
+        algorithms = [a for a in algorithms if a in ("SCAN", "C-SCAN", "LOOK", "C-LOOK")]
+        if not algorithms:
+            parser.error(f"{args.algorithm} is not supported by the vectorized and movement-only engines")
+
+    try:
+        requests = read_requests(args.input, args.input_format, args.max_cylinder, args.geometry, args.skip_header)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    results = schedule(requests, algorithms, args.start, args.direction, args.max_cylinder,
+                       args.engine, args.movement_only)
+    write_results(results, args, sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
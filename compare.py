@@ -0,0 +1,60 @@
+from bisect import bisect_left, bisect_right   # Binary search for the split around start
+from registry import names, run                 # Registered algorithms beyond the shared kernel
+
+
+def _walk(start, parts):
+    # Concatenates the service order and sums the head movement along it
+    sequence = []
+    movement = 0
+    current = start
+    for part in parts:
+        for r in part:
+            movement += abs(current - r)    # Distance to the next stop
+            current = r
+        sequence.extend(part)
+    return sequence, movement
+
+
+def run_all(requests, start, direction, max_cylinder):
+    # Computes SCAN, C-SCAN, LOOK and C-LOOK from a single sort and a single split.
+    # Returns a dict mapping algorithm name to (sequence, movement), matching run_scan,
+    # run_cscan, run_look and run_clook exactly.
+    requests = sorted(requests)
+
+    if direction == 'right':
+        split = bisect_left(requests, start)         # Requests >= start are serviced first
+        right = requests[split:]                      # Ascending
+        left = requests[:split]                       # Ascending
+        left_desc = left[::-1]
+        current = right[-1] if right else start       # Head position after the first sweep
+        to_end = [max_cylinder] if current != max_cylinder else []
+        return {
+            "SCAN": _walk(start, (right, to_end, left_desc)),
+            "C-SCAN": _walk(start, (right, to_end, [0] if left else [], left)),
+            "LOOK": _walk(start, (right, left_desc)),
+            "C-LOOK": _walk(start, (right, left)),
+        }
+
+    split = bisect_right(requests, start)             # Requests <= start are serviced first
+    left = requests[:split][::-1]                     # Descending
+    right = requests[split:]                          # Ascending
+    right_desc = right[::-1]
+    current = left[-1] if left else start
+    to_start = [0] if current != 0 else []
+    return {
+        "SCAN": _walk(start, (left, to_start, right)),
+        "C-SCAN": _walk(start, (left, to_start, [max_cylinder] if right else [], right_desc)),
+        "LOOK": _walk(start, (left, right)),
+        "C-LOOK": _walk(start, (left, right_desc)),
+    }
+
+
+def run_registered(requests, start, direction, max_cylinder):
+    # Runs every registered algorithm. SCAN, C-SCAN, LOOK and C-LOOK come from the shared
+    # single-sort kernel; any other algorithm is run through the registry.
+    # Returns a dict in registry order mapping name to (sequence, movement).
+    shared = run_all(requests, start, direction, max_cylinder)
+    return {
+        name: shared[name] if name in shared else run(name, requests, start, direction, max_cylinder)
+        for name in names()
+    }
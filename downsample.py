@@ -0,0 +1,21 @@
+import numpy as np                  # Import NumPy for vectorized bucketing
+
+
+def minmax_downsample(y, max_points):
+    # Shape-preserving downsampling for line plots. The series is split into equal buckets
+    # and each bucket keeps its minimum and maximum, so every sweep end and wrap jump
+    # survives. Returns (indices, values) with at most max_points points, in order.
+    y = np.asarray(y)
+    n = y.size
+    if n <= max_points:
+        return np.arange(n), y
+    buckets = max(1, (max_points - 2) // 2)                 # Reserve room for the first/last point
+    size = -(-n // buckets)                                 # Ceiling division: points per bucket
+    padded = np.concatenate((y, np.repeat(y[-1:], buckets * size - n)))
+    rows = padded.reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    lows = rows.argmin(axis=1) + offsets
+    highs = rows.argmax(axis=1) + offsets
+    indices = np.unique(np.concatenate(([0], lows, highs, [n - 1])))   # Sorted, de-duplicated
+    indices = indices[indices < n]                          # Drop indices that landed in the padding
+    return indices, y[indices]
@@ -0,0 +1,15 @@
+from nstep_scan import scan_batches  # FSCAN sweeps frozen queues the same way as N-step SCAN
+
+
+def fscan_batches(requests, initial=None):
+    # requests are in arrival order. The first `initial` of them (default: half) are queued
+    # when the head starts and are frozen for the first sweep; the rest arrive during that
+    # sweep, wait in the second queue and are frozen for the next sweep
+    if initial is None:
+        initial = (len(requests) + 1) // 2
+    return [requests[:initial], requests[initial:]]
+
+
+def run_fscan(requests, start, direction, max_cylinder, initial=None):
+    # Return the service sequence and the total movement
+    return scan_batches(fscan_batches(requests, initial), start, direction, max_cylinder)
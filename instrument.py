@@ -0,0 +1,141 @@
+import sys                          # Import sys for allocated-block counts
+import threading                    # Import threading so each session records separately
+import time                         # Import time for phase wall times
+from contextlib import contextmanager   # Import contextmanager for recording sessions
+from functools import wraps         # Import wraps to keep decorated function names
+
+# Opt-in hot-path instrumentation. Code marks phases with `with phase("compute.sort"):` and
+# bumps counters with count(); both do nothing unless a recording() is active on the
+# current thread. Phase names start with their category ("compute" or "render") so a run
+# can be split into time spent scheduling versus building output.
+
+_local = threading.local()          # Recorder active on this thread, if any
+_lock = threading.Lock()
+_active = 0                         # Recorders active on any thread; 0 short-circuits every hook
+
+
+class _NoOp:
+    # Shared context manager returned by phase() while nothing is recording
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP = _NoOp()
+
+
+class Recorder:
+    # Collects phase timings and counters for one recording session
+
+    def __init__(self):
+        self.phases = {}            # name -> [calls, seconds, allocated blocks, outermost]
+        self.counters = {}          # group -> {name: value}
+        self.depth = 0              # Nesting level of the phase currently running
+        self.started = time.perf_counter()
+        self.elapsed = None
+
+    def metrics(self):
+        # Structured summary: per-phase calls, wall ms and net allocated blocks; totals per
+        # category over outermost phases only (nested phases are already inside them); counters
+        phases = {
+            name: {"calls": calls, "wall_ms": seconds * 1000.0, "alloc_blocks": blocks}
+            for name, (calls, seconds, blocks, _) in sorted(self.phases.items(), key=lambda item: -item[1][1])
+        }
+        categories = {}
+        for name, (_, seconds, _, outermost) in self.phases.items():
+            category = name.split(".", 1)[0]
+            categories[category] = categories.get(category, 0.0) + outermost * 1000.0
+        elapsed = self.elapsed if self.elapsed is not None else time.perf_counter() - self.started
+        return {
+            "total_ms": elapsed * 1000.0,
+            "categories_ms": categories,
+            "phases": phases,
+            "counters": {group: dict(values) for group, values in self.counters.items()},
+        }
+
+
+class _Phase:
+    # Times one phase and counts the memory blocks it leaves allocated
+
+    __slots__ = ("recorder", "name", "started", "blocks")
+
+    def __init__(self, recorder, name):
+        self.recorder = recorder
+        self.name = name
+
+    def __enter__(self):
+        self.recorder.depth += 1
+        self.blocks = sys.getallocatedblocks()
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        seconds = time.perf_counter() - self.started
+        blocks = sys.getallocatedblocks() - self.blocks
+        recorder = self.recorder
+        recorder.depth -= 1
+        entry = recorder.phases.setdefault(self.name, [0, 0.0, 0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+        entry[2] += blocks
+        if not recorder.depth:
+            entry[3] += seconds
+        return False
+
+
+def _recorder():
+    # The recorder for this thread, or None; the global count keeps the disabled path to one check
+    return getattr(_local, "recorder", None) if _active else None
+
+
+def enabled():
+    # Whether a recording is active on this thread (lets callers skip computing counters)
+    return _recorder() is not None
+
+
+def phase(name):
+    # Context manager timing the enclosed block under `name` while recording
+    recorder = _recorder()
+    return _NOOP if recorder is None else _Phase(recorder, name)
+
+
+def timed(name):
+    # Decorator form of phase() for functions that are one phase as a whole
+    def decorate(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def count(name, value=1, group="all"):
+    # Adds to a counter while recording; group separates e.g. per-algorithm counts
+    recorder = _recorder()
+    if recorder is not None:
+        values = recorder.counters.setdefault(group, {})
+        values[name] = values.get(name, 0) + value
+
+
+@contextmanager
+def recording():
+    # Records every phase and counter on this thread for the duration of the block and
+    # yields the Recorder; read recorder.metrics() afterwards
+    global _active
+    recorder = Recorder()
+    previous = getattr(_local, "recorder", None)
+    _local.recorder = recorder
+    with _lock:
+        _active += 1
+    try:
+        yield recorder
+    finally:
+        recorder.elapsed = time.perf_counter() - recorder.started
+        _local.recorder = previous
+        with _lock:
+            _active -= 1
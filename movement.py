@@ -0,0 +1,127 @@
+import numpy as np                  # Import NumPy for chunked scans and vectorized formulas
+
+# Number of elements scanned at a time from large (e.g. memory-mapped) arrays
+CHUNK_SIZE = 1 << 20
+
+
+def _bounds_from_list(requests, start, direction):
+    # Single pass over a plain Python iterable, tracking min/max on each side of start
+    lo_min = lo_max = hi_min = hi_max = None
+    for r in requests:
+        if r > start or (r == start and direction == 'right'):     # Request lies on the high side
+            if hi_min is None or r < hi_min:
+                hi_min = r
+            if hi_max is None or r > hi_max:
+                hi_max = r
+        else:                                                       # Request lies on the low side
+            if lo_min is None or r < lo_min:
+                lo_min = r
+            if lo_max is None or r > lo_max:
+                lo_max = r
+    return lo_min, lo_max, hi_min, hi_max
+
+
+def _bounds_from_array(requests, start, direction):
+    # Same as _bounds_from_list, scanning the array in fixed-size chunks so memory stays bounded
+    lo_min = lo_max = hi_min = hi_max = None
+    flat = requests.reshape(-1)
+    for offset in range(0, flat.size, CHUNK_SIZE):
+        chunk = flat[offset:offset + CHUNK_SIZE]
+        high = chunk >= start if direction == 'right' else chunk > start
+        hi = chunk[high]
+        lo = chunk[~high]
+        if hi.size:
+            hi_min = int(hi.min()) if hi_min is None else min(hi_min, int(hi.min()))
+            hi_max = int(hi.max()) if hi_max is None else max(hi_max, int(hi.max()))
+        if lo.size:
+            lo_min = int(lo.min()) if lo_min is None else min(lo_min, int(lo.min()))
+            lo_max = int(lo.max()) if lo_max is None else max(lo_max, int(lo.max()))
+    return lo_min, lo_max, hi_min, hi_max
+
+
+def side_bounds(requests, start, direction):
+    # Returns (lo_min, lo_max, hi_min, hi_max) of the requests on each side of start.
+    # The split matches the run_* functions: requests equal to start belong to the side
+    # serviced first. A side with no requests reports None for both bounds.
+    if isinstance(requests, np.ndarray):
+        return _bounds_from_array(requests, start, direction)
+    return _bounds_from_list(requests, start, direction)
+
+
+def movement_from_bounds(algorithm, direction, start, max_cylinder, lo_min, lo_max, has_lo, hi_min, hi_max, has_hi):
+    # Closed-form total head movement from the side bounds. All numeric arguments may be
+    # NumPy arrays of the same shape, in which case one movement per element is returned.
+    # Bounds of an empty side must be numeric placeholders (e.g. 0); has_lo/has_hi mask them out.
+    start = np.asarray(start, dtype=np.int64)
+    max_cylinder = np.asarray(max_cylinder, dtype=np.int64)
+    lo_min, lo_max = np.asarray(lo_min, dtype=np.int64), np.asarray(lo_max, dtype=np.int64)
+    hi_min, hi_max = np.asarray(hi_min, dtype=np.int64), np.asarray(hi_max, dtype=np.int64)
+    lo_span = lo_max - lo_min
+    hi_span = hi_max - hi_min
+
+    if direction == 'right':
+        # Sweep up through the high side first (ascending)
+        current = np.where(has_hi, hi_max, start)
+        first = np.where(has_hi, np.abs(hi_min - start) + hi_span, 0)
+        if algorithm == "SCAN":
+            # Run to the end, then sweep down through the low side
+            rest = np.abs(max_cylinder - current) + np.where(has_lo, np.abs(lo_max - max_cylinder) + lo_span, 0)
+        elif algorithm == "C-SCAN":
+            # Run to the end, wrap to 0, then sweep up through the low side
+            rest = np.abs(max_cylinder - current) + np.where(has_lo, max_cylinder + np.abs(lo_min) + lo_span, 0)
+        elif algorithm == "LOOK":
+            # Reverse at the last request and sweep down through the low side
+            rest = np.where(has_lo, np.abs(lo_max - current) + lo_span, 0)
+        elif algorithm == "C-LOOK":
+            # Jump to the lowest request and sweep up through the low side
+            rest = np.where(has_lo, np.abs(lo_min - current) + lo_span, 0)
+        else:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+    else:
+        # Sweep down through the low side first (descending)
+        current = np.where(has_lo, lo_min, start)
+        first = np.where(has_lo, np.abs(lo_max - start) + lo_span, 0)
+        if algorithm == "SCAN":
+            # Run to cylinder 0, then sweep up through the high side
+            rest = np.abs(current) + np.where(has_hi, np.abs(hi_min) + hi_span, 0)
+        elif algorithm == "C-SCAN":
+            # Run to cylinder 0, wrap to the max cylinder, then sweep down through the high side
+            rest = np.abs(current) + np.where(has_hi, max_cylinder + np.abs(hi_max - max_cylinder) + hi_span, 0)
+        elif algorithm == "LOOK":
+            # Reverse at the last request and sweep up through the high side
+            rest = np.where(has_hi, np.abs(hi_min - current) + hi_span, 0)
+        elif algorithm == "C-LOOK":
+            # Jump to the highest request and sweep down through the high side
+            rest = np.where(has_hi, np.abs(hi_max - current) + hi_span, 0)
+        else:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+    return first + rest
+
+
+def _scalar_movement(algorithm, direction, start, max_cylinder, bounds):
+    # Evaluates the closed form for a single configuration and returns a Python int
+    lo_min, lo_max, hi_min, hi_max = bounds
+    has_lo = lo_min is not None
+    has_hi = hi_min is not None
+    return int(movement_from_bounds(
+        algorithm, direction, start, max_cylinder,
+        lo_min if has_lo else 0, lo_max if has_lo else 0, has_lo,
+        hi_min if has_hi else 0, hi_max if has_hi else 0, has_hi
+    ))
+
+
+def movement_only(requests, start, direction, max_cylinder, algorithm):
+    # Total head movement of one algorithm without sorting or building the sequence.
+    # Works in one O(n) pass over lists, NumPy arrays and memory-mapped arrays.
+    bounds = side_bounds(requests, start, direction)
+    return _scalar_movement(algorithm, direction, start, max_cylinder, bounds)
+
+
+def movements_only(requests, start, direction, max_cylinder):
+    # Total head movement of SCAN, C-SCAN, LOOK and C-LOOK from a single pass.
+    # Returns a dict mapping algorithm name to movement.
+    bounds = side_bounds(requests, start, direction)
+    return {
+        algorithm: _scalar_movement(algorithm, direction, start, max_cylinder, bounds)
+        for algorithm in ("SCAN", "C-SCAN", "LOOK", "C-LOOK")
+    }
@@ -0,0 +1,32 @@
+from scan import run_scan           # Each batch is serviced with a SCAN sweep
+
+# Default number of requests per batch
+DEFAULT_N = 10
+
+
+def scan_batches(batches, start, direction, max_cylinder):
+    # Services each batch with a full SCAN sweep, continuing from where the previous one ended
+    movement = 0
+    sequence = []
+    current = start
+    for batch in batches:
+        if not batch:
+            continue                            # An empty queue needs no sweep
+        batch_sequence, batch_movement = run_scan(batch, current, direction, max_cylinder)
+        sequence.extend(batch_sequence)         # Add the batch's service order
+        movement += batch_movement              # Add the batch's head movement
+        current = batch_sequence[-1]            # Head position where the sweep ended
+        # A SCAN sweep always ends travelling the other way (at the disk end or past it)
+        direction = 'left' if direction == 'right' else 'right'
+    return sequence, movement
+
+
+def nstep_batches(requests, n=DEFAULT_N):
+    # Split the queue, in arrival order, into batches of at most n requests; later arrivals
+    # cannot delay a batch that is already being swept
+    return [requests[i:i + n] for i in range(0, len(requests), n)]
+
+
+def run_nstep_scan(requests, start, direction, max_cylinder, n=DEFAULT_N):
+    # Return the service sequence and the total movement
+    return scan_batches(nstep_batches(requests, n), start, direction, max_cylinder)
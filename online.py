@@ -0,0 +1,109 @@
+from bisect import bisect_left, bisect_right, insort   # Ordered pending-request index
+from collections import deque                           # FIFO of arrivals waiting for a batch
+from nstep_scan import DEFAULT_N                        # Default N-step SCAN batch size
+
+# Scheduling policies understood by the simulator
+POLICIES = ("SCAN", "C-SCAN", "LOOK", "C-LOOK", "SSTF", "N-step SCAN", "FSCAN")
+# Policies that sweep a frozen batch with SCAN while new arrivals wait in a FIFO queue
+BATCHED = ("N-step SCAN", "FSCAN")
+
+
+def _nearest_ahead(pending, head, moving_right):
+    # Index of the closest pending request at or beyond the head in the current direction,
+    # or None. pending holds (cylinder, request_id) tuples in ascending order.
+    if moving_right:
+        index = bisect_left(pending, (head,))                       # First cylinder >= head
+        return index if index < len(pending) else None
+    index = bisect_right(pending, (head, float('inf'))) - 1         # Last cylinder <= head
+    return index if index >= 0 else None
+
+
+def _dispatch(policy, pending, head, moving_right, max_cylinder):
+    # Decides the next head move in O(log n).
+    # Returns (target cylinder, pending index to service or None, is_wrap_jump, moving_right).
+    if policy == "SSTF":
+        up = bisect_left(pending, (head,))                          # Closest at or above the head
+        down = up - 1                                               # Closest below the head
+        if up < len(pending) and (down < 0 or pending[up][0] - head < head - pending[down][0]
+                                  or (pending[up][0] - head == head - pending[down][0] and moving_right)):
+            index = up
+        else:
+            index = down
+        target = pending[index][0]
+        return target, index, False, moving_right if target == head else target > head
+    index = _nearest_ahead(pending, head, moving_right)
+    if index is not None:
+        return pending[index][0], index, False, moving_right        # Keep sweeping
+    end = max_cylinder if moving_right else 0
+    if policy == "LOOK" or (policy == "SCAN" and head == end):
+        moving_right = not moving_right                             # Reverse direction
+        index = _nearest_ahead(pending, head, moving_right)
+        return pending[index][0], index, False, moving_right
+    if policy in ("SCAN", "C-SCAN") and head != end:
+        return end, None, False, moving_right                       # Run to the end of the disk
+    if policy == "C-SCAN":
+        return (0 if moving_right else max_cylinder), None, True, moving_right  # Wrap around
+    index = 0 if moving_right else len(pending) - 1                 # C-LOOK: jump to the far request
+    return pending[index][0], index, True, moving_right
+
+
+def simulate(arrivals, start, direction, max_cylinder, policy, speed=1, service_time=0, n=DEFAULT_N):
+    # Event-driven simulation of a scheduling policy over timestamped arrivals.
+    # arrivals is an iterable of (time, cylinder) pairs; the head travels `speed` cylinders
+    # per time unit and each request takes `service_time` once the head reaches it.
+    # Requests arriving while the head is moving are considered as soon as they arrive,
+    # except during a C-SCAN / C-LOOK wrap jump. N-step SCAN and FSCAN only consider them
+    # once the current batch (n requests, or everything queued for FSCAN) has been swept.
+    # The head idles when nothing is pending.
+    # Returns (served, movement) where served lists (cylinder, arrival_time, completion_time)
+    # in service order.
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy: {policy}")
+    arrivals = sorted(arrivals)                     # Process arrivals in time order
+    pending = []                                    # Sorted (cylinder, request_id) index
+    waiting = deque()                               # Arrivals held back by batched policies
+    sweep_policy = "SCAN" if policy in BATCHED else policy
+    served = []
+    movement = 0
+    head = start
+    time = 0
+    moving_right = direction == 'right'
+    next_arrival = 0
+
+    while next_arrival < len(arrivals) or pending or waiting:
+        # Admit every request that has arrived by now
+        while next_arrival < len(arrivals) and arrivals[next_arrival][0] <= time:
+            if policy in BATCHED:
+                waiting.append((arrivals[next_arrival][1], next_arrival))
+            else:
+                insort(pending, (arrivals[next_arrival][1], next_arrival))
+            next_arrival += 1
+        if not pending and waiting:
+            # Freeze the next batch: N requests for N-step SCAN, the whole queue for FSCAN
+            for _ in range(min(n, len(waiting)) if policy == "N-step SCAN" else len(waiting)):
+                insort(pending, waiting.popleft())
+        if not pending:
+            time = arrivals[next_arrival][0]        # Idle until the next arrival
+            continue
+
+        target, index, jump, moving_right = _dispatch(sweep_policy, pending, head, moving_right, max_cylinder)
+        distance = abs(target - head)
+        arrival_at = time + distance / speed
+
+        # A new request may arrive before the head gets there; stop and re-decide
+        if not jump and next_arrival < len(arrivals) and arrivals[next_arrival][0] < arrival_at:
+            step = (arrivals[next_arrival][0] - time) * speed
+            head += step if target > head else -step
+            movement += step
+            time = arrivals[next_arrival][0]
+            continue
+
+        movement += distance
+        head = target
+        time = arrival_at
+        if index is not None:
+            cylinder, request_id = pending.pop(index)
+            time += service_time
+            served.append((cylinder, arrivals[request_id][0], time))
+
+    return served, movement
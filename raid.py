@@ -0,0 +1,145 @@
+import os                                           # Import os to size the worker pool
+from collections import namedtuple                  # Import namedtuple for the array layout
+from concurrent.futures import ProcessPoolExecutor  # Import process pool for per-disk scheduling
+import numpy as np                                  # Import NumPy for vectorized striping
+from result import schedule                         # Run any registered algorithm per disk
+from timing import DiskModel, algorithm_timing      # Per-disk service time
+from instrument import timed                        # Opt-in phase timer
+
+# Supported array layouts
+LAYOUTS = ("RAID0", "RAID1", "RAID5")
+# Fewest disks each layout can be built from
+MIN_DISKS = {"RAID0": 1, "RAID1": 2, "RAID5": 3}
+
+# Array geometry. The logical request values are addresses on the array volume in the same
+# units as cylinders; stripe_unit consecutive addresses go to one disk before moving on.
+ArrayLayout = namedtuple("ArrayLayout", [
+    "level",            # One of LAYOUTS
+    "disks",            # Number of spindles
+    "stripe_unit",      # Addresses per strip (ignored by RAID1, which mirrors whole disks)
+], defaults=["RAID0", 4, 8])
+
+
+def disk_max_cylinder(layout, max_cylinder):
+    # Highest physical cylinder on each member disk for a logical volume of 0..max_cylinder
+    if layout.level == "RAID1":
+        return max_cylinder
+    data = layout.disks - (layout.level == "RAID5")             # Data strips per stripe row
+    rows = -(-(max_cylinder + 1) // (layout.stripe_unit * data))
+    return rows * layout.stripe_unit - 1
+
+
+def map_requests(requests, layout, writes=False):
+    # Maps logical addresses to (disk, physical cylinder) accesses. Reads touch one disk:
+    # RAID0/RAID5 stripe round-robin (RAID5 skips the rotating parity disk of each row) and
+    # RAID1 spreads reads over the mirrors in turn. With writes=True every request also hits
+    # the other mirrors (RAID1) or the row's parity strip at the same offset (RAID5).
+    # Returns (disk index array, cylinder array), one entry per access in request order.
+    if layout.level not in LAYOUTS:
+        raise ValueError(f"Unknown array layout: {layout.level}")
+    if layout.disks < MIN_DISKS[layout.level]:
+        raise ValueError(f"{layout.level} needs at least {MIN_DISKS[layout.level]} disks")
+    if layout.stripe_unit < 1:
+        raise ValueError("Stripe unit must be at least 1")
+    requests = np.asarray(requests, dtype=np.int64)
+    n = layout.disks
+
+    if layout.level == "RAID1":
+        if writes:
+            return np.tile(np.arange(n), requests.size), np.repeat(requests, n)
+        return np.arange(requests.size) % n, requests
+
+    data = n - (layout.level == "RAID5")
+    unit, offset = np.divmod(requests, layout.stripe_unit)
+    row, column = np.divmod(unit, data)
+    cylinders = row * layout.stripe_unit + offset
+    if layout.level == "RAID0":
+        return column, cylinders
+    parity = n - 1 - row % n                                    # Left-symmetric parity rotation
+    disks = (parity + 1 + column) % n
+    if writes:
+        # Interleave each data access with its parity update so request order is kept
+        return np.column_stack((disks, parity)).ravel(), np.repeat(cylinders, 2)
+    return disks, cylinders
+
+
+def split_requests(requests, layout, writes=False):
+    # Per-disk request queues, each in arrival order
+    disks, cylinders = map_requests(requests, layout, writes)
+    order = np.argsort(disks, kind='stable')
+    bounds = np.searchsorted(disks[order], np.arange(layout.disks + 1))
+    return [cylinders[order[lo:hi]] for lo, hi in zip(bounds[:-1], bounds[1:])]
+
+
+def _schedule_disk(requests, start, direction, max_cylinder, algorithm, model):
+    # Schedules one disk's queue; runs in a worker process
+    if not requests.size:
+        return {"requests": 0, "movement": 0, "makespan_ms": 0.0, "mean_completion_ms": 0.0}
+    result = schedule(algorithm, requests, start, direction, max_cylinder)
+    timing = algorithm_timing(requests, start, direction, max_cylinder, algorithm, model, result)
+    return {
+        "requests": int(requests.size),
+        "movement": result.movement,
+        "makespan_ms": timing["makespan_ms"],
+        "mean_completion_ms": timing["mean_completion_ms"],
+    }
+
+
+def _summarize(disks, model):
+    # Array-level totals from the per-disk results. Imbalance is the busiest disk over the
+    # mean (1.0 is perfectly even), for both request count and busy time.
+    counts = np.array([d["requests"] for d in disks], dtype=np.float64)
+    makespans = np.array([d["makespan_ms"] for d in disks])
+    makespan = float(makespans.max())
+    total = int(counts.sum())
+    iops = total / (makespan / 1000.0) if makespan > 0 else 0.0
+    return {
+        "disks": disks,
+        "total_movement": sum(d["movement"] for d in disks),
+        "makespan_ms": makespan,
+        "iops": iops,
+        "mb_s": iops * model.request_kb / 1024.0,
+        "load_imbalance": float(counts.max() / counts.mean()) if total else 1.0,
+        "time_imbalance": float(makespan / makespans.mean()) if makespan > 0 else 1.0,
+    }
+
+
+@timed("compute.array")
+def simulate_arrays(requests, start, direction, max_cylinder, algorithms, layout=ArrayLayout(),
+                    writes=False, model=DiskModel(), workers=None):
+    # Runs each algorithm on every member disk of the array. Every (algorithm, disk) pair is
+    # an independent task fanned out over one process pool; workers=1 runs in-process.
+    # Each head starts at the physical position matching the logical start.
+    # Returns {algorithm: report} where report holds the per-disk results under "disks"
+    # plus total movement, array makespan (the slowest disk), IOPS, MB/s and imbalance.
+    queues = split_requests(requests, layout, writes)
+    disk_max = disk_max_cylinder(layout, max_cylinder)
+    disk_start = start * (disk_max + 1) // (max_cylinder + 1)
+    tasks = [(algorithm, queue) for algorithm in algorithms for queue in queues]
+    args = (
+        [queue for _, queue in tasks],
+        [disk_start] * len(tasks),
+        [direction] * len(tasks),
+        [disk_max] * len(tasks),
+        [algorithm for algorithm, _ in tasks],
+        [model] * len(tasks),
+    )
+
+    if workers == 1 or len(tasks) <= 1:
+        results = list(map(_schedule_disk, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, len(tasks))) as pool:
+            results = list(pool.map(_schedule_disk, *args))
+
+    reports = {}
+    for a, algorithm in enumerate(algorithms):
+        disks = results[a * layout.disks:(a + 1) * layout.disks]
+        reports[algorithm] = {**_summarize(disks, model), "disk_max_cylinder": disk_max}
+    return reports
+
+
+def simulate_array(requests, start, direction, max_cylinder, algorithm, layout=ArrayLayout(),
+                   writes=False, model=DiskModel(), workers=None):
+    # Array report for a single algorithm (see simulate_arrays)
+    return simulate_arrays(requests, start, direction, max_cylinder, (algorithm,),
+                           layout, writes, model, workers)[algorithm]
@@ -0,0 +1,119 @@
+from collections import namedtuple  # Import namedtuple for registry entries
+from scan import run_scan           # Import SCAN algorithm implementation
+from cscan import run_cscan         # Import C-SCAN algorithm implementation
+from look import run_look           # Import LOOK algorithm implementation
+from clook import run_clook         # Import C-LOOK algorithm implementation
+from sstf import run_sstf           # Import SSTF algorithm implementation
+from nstep_scan import nstep_batches, run_nstep_scan   # Import N-step SCAN algorithm implementation
+from fscan import fscan_batches, run_fscan          # Import FSCAN algorithm implementation
+
+# One registered scheduling algorithm
+Algorithm = namedtuple("Algorithm", [
+    "name",                 # Display name, also the registry key
+    "run",                  # Function returning (sequence, movement)
+    "color",                # Plot color
+    "description",          # One-line description used in tooltips
+    "characteristics",      # Bullet points shown under single-algorithm results
+    "traits",               # Values for the KEY_FEATURES comparison table, in order
+    "uses_max_cylinder",    # Whether run takes (requests, start, direction, max_cylinder)
+    "circular",             # Whether the return trip is a wrap jump rather than a sweep
+    "batches",              # For batched SCAN variants: splits requests into the queues swept in turn
+])
+
+# Rows of the "Key Differences" table; every algorithm supplies one trait per feature
+KEY_FEATURES = ["Direction Handling", "Return Path", "Uniform Wait Time", "Empty End Handling", "Optimal For"]
+
+# Registered algorithms, in display order
+REGISTRY = {}
+
+
+def register(name, run, color, description, characteristics=(), traits=None,
+             uses_max_cylinder=True, circular=False, batches=None):
+    # Adds an algorithm to the registry so the UI and comparison code pick it up
+    traits = tuple(traits) if traits is not None else ("",) * len(KEY_FEATURES)
+    if len(traits) != len(KEY_FEATURES):
+        raise ValueError(f"{name} must supply one trait per key feature")
+    REGISTRY[name] = Algorithm(name, run, color, description, tuple(characteristics),
+                               traits, uses_max_cylinder, circular, batches)
+    return REGISTRY[name]
+
+
+def get(name):
+    # Looks up a registered algorithm by name
+    if name not in REGISTRY:
+        raise ValueError(f"Unknown algorithm: {name}")
+    return REGISTRY[name]
+
+
+def names():
+    # Names of every registered algorithm, in display order
+    return list(REGISTRY)
+
+
+def run(name, requests, start, direction, max_cylinder):
+    # Runs a registered algorithm with the uniform (requests, start, direction, max_cylinder) call
+    algorithm = get(name)
+    if algorithm.uses_max_cylinder:
+        return algorithm.run(requests, start, direction, max_cylinder)
+    return algorithm.run(requests, start, direction)
+
+
+register(
+    "SCAN", run_scan, '#2B7DE9',
+    "SCAN (Elevator): Services requests in one direction, then reverses at the end.",
+    ["Also known as the elevator algorithm",
+     "Services requests in one direction until end, then reverses"],
+    ["Reverses direction", "Services return path", "No", "Visits end always", "Moderate loads"]
+)
+register(
+    "C-SCAN", run_cscan, '#FF4B4B',
+    "C-SCAN: Services requests in one direction, jumps to start after reaching end.",
+    ["Circular version of SCAN",
+     "Treats cylinders as a circular list",
+     "Jumps back to start after reaching end"],
+    ["Circular movement", "Jumps to start", "Yes", "Visits end always", "Heavy loads"],
+    circular=True
+)
+register(
+    "LOOK", run_look, '#2ECC71',
+    "LOOK: Like SCAN, but only goes as far as the last request in each direction.",
+    ["Similar to SCAN but only goes as far as the last request in each direction",
+     "Does not go to the end of the disk unless requested"],
+    ["Reverses direction", "Services return path", "No", "Visits only requested cylinders", "Moderate loads"],
+    uses_max_cylinder=False
+)
+register(
+    "C-LOOK", run_clook, '#E67E22',
+    "C-LOOK: Like C-SCAN, but only goes as far as the last request before jumping.",
+    ["Circular version of LOOK",
+     "Jumps back to the first request after reaching the last"],
+    ["Circular movement", "Jumps to start", "Yes", "Visits only requested cylinders", "Heavy loads"],
+    circular=True
+)
+register(
+    "SSTF", run_sstf, '#9B59B6',
+    "SSTF: Always services the pending request closest to the head.",
+    ["Shortest Seek Time First: greedy nearest-request choice",
+     "Low total movement, but far requests can starve under load",
+     "Direction only breaks ties between equally close requests"],
+    ["Nearest request first", "Services both sides", "No", "Visits only requested cylinders", "Light loads"],
+    uses_max_cylinder=False
+)
+register(
+    "N-step SCAN", run_nstep_scan, '#16A085',
+    "N-step SCAN: Splits the queue into batches of N and sweeps each batch with SCAN.",
+    ["Queue is split, in arrival order, into batches of N requests",
+     "Each batch is serviced by a full SCAN sweep",
+     "New requests cannot hold up the batch being swept"],
+    ["Reverses direction", "Services return path", "Bounded by N", "Visits end always", "Heavy loads"],
+    batches=nstep_batches
+)
+register(
+    "FSCAN", run_fscan, '#7F8C8D',
+    "FSCAN: Freezes the queue for each sweep; new arrivals wait for the next one.",
+    ["Two queues: one frozen and swept with SCAN, one collecting arrivals",
+     "Queues swap when a sweep completes",
+     "Prevents arm stickiness from a stream of nearby requests"],
+    ["Reverses direction", "Services return path", "Bounded per sweep", "Visits end always", "Heavy loads"],
+    batches=fscan_batches
+)
@@ -0,0 +1,229 @@
+import numpy as np                  # Import NumPy for the contiguous position buffer
+from batch import ALGORITHMS, service_segments  # Vectorized service order for the SCAN family
+from registry import get, names, run    # Registered algorithms outside the vectorized engine
+from instrument import count, enabled, phase    # Opt-in phase timers and counters
+
+
+def _buffer_dtype(lowest, highest):
+    # int32 halves the footprint of int64 and is enough for any realistic disk. The range
+    # comes from the positions themselves: LOOK, C-LOOK and SSTF never consult max_cylinder,
+    # so requests beyond it would otherwise wrap around in an int32 buffer.
+    return np.int32 if -2 ** 31 <= lowest and highest < 2 ** 31 else np.int64
+
+
+class ScheduleResult:
+    # Compact schedule: one contiguous integer buffer holding the head positions with the
+    # start at index 0, plus the run parameters and a few marker index arrays. Unpacks like
+    # the (sequence, movement) tuples returned by the run_* functions.
+    __slots__ = (
+        "algorithm", "start", "direction", "max_cylinder",
+        "positions",    # Head positions: start followed by every stop in service order
+        "movement",     # Total head movement in cylinders
+        "end_visits",   # Sequence indices of end-of-disk stops that service no request
+        "wraps",        # Sequence indices reached by a wrap jump (C-SCAN / C-LOOK)
+        "reversals",    # Sequence indices where the head changed sweep direction
+    )
+
+    def __init__(self, algorithm, positions, movement, start, direction, max_cylinder,
+                 end_visits=(), wraps=(), reversals=()):
+        self.algorithm = algorithm
+        self.positions = positions
+        self.movement = int(movement)
+        self.start = start
+        self.direction = direction
+        self.max_cylinder = max_cylinder
+        self.end_visits = np.asarray(end_visits, dtype=np.int64)
+        self.wraps = np.asarray(wraps, dtype=np.int64)
+        self.reversals = np.asarray(reversals, dtype=np.int64)
+
+    @property
+    def sequence(self):
+        # Service order without the start position (a view, no copy)
+        return self.positions[1:]
+
+    @property
+    def size(self):
+        # Number of head stops
+        return self.positions.size - 1
+
+    @property
+    def nbytes(self):
+        # Memory held by the buffer and markers
+        return (self.positions.nbytes + self.end_visits.nbytes
+                + self.wraps.nbytes + self.reversals.nbytes)
+
+    @property
+    def is_request(self):
+        # Boolean mask over the sequence: True where a stop services a request
+        mask = np.ones(self.size, dtype=bool)
+        mask[self.end_visits] = False
+        return mask
+
+    @property
+    def is_wrap(self):
+        # Boolean mask over the sequence: True where the step to a stop is a wrap jump
+        mask = np.zeros(self.size, dtype=bool)
+        mask[self.wraps] = True
+        return mask
+
+    def __iter__(self):
+        # Allows `sequence, movement = result`
+        return iter((self.sequence, self.movement))
+
+    def tolist(self):
+        # Service order as a list of Python ints, for JSON export
+        return self.sequence.tolist()
+
+    def __repr__(self):
+        return (f"ScheduleResult({self.algorithm!r}, {self.size} stops, movement={self.movement}, "
+                f"start={self.start}, direction={self.direction!r}, max_cylinder={self.max_cylinder})")
+
+
+def counters(result):
+    # Algorithm counters read off a result's markers
+    return {
+        "requests_served": result.size - result.end_visits.size,
+        "end_of_disk_visits": int(result.end_visits.size),
+        "wrap_jumps": int(result.wraps.size),
+        "direction_reversals": int(result.reversals.size),
+    }
+
+
+def _record(result):
+    # Adds a freshly built result's counters to the active recording, if any
+    if enabled():
+        for name, value in counters(result).items():
+            count(name, value, group=result.algorithm)
+    return result
+
+
+def _reversals(positions, wraps):
+    # Indices where the head turns around; wrap jumps are not reversals
+    steps = np.diff(positions)
+    moving = np.flatnonzero(steps)
+    moving = moving[~np.isin(moving, wraps)]
+    signs = np.sign(steps[moving])
+    return moving[1:][signs[1:] != signs[:-1]]
+
+
+def _wrap_steps(positions, direction, circular):
+    # On circular algorithms the only steps against the sweep direction are wrap jumps
+    if not circular:
+        return np.zeros(0, dtype=np.int64)
+    steps = np.diff(positions)
+    return np.flatnonzero(steps < 0 if direction == 'right' else steps > 0)
+
+
+def _end_visits(requests, sequence, max_cylinder):
+    # Fallback for registered algorithms outside the vectorized and batched engines: stops at
+    # cylinder 0 or max_cylinder beyond the number of such requests are end-of-disk visits
+    # (the first ones, since a single sweep reaches the end before servicing from it)
+    requests = np.asarray(requests)
+    visits = []
+    for end in {0, max_cylinder}:
+        at_end = np.flatnonzero(sequence == end)
+        visits.append(at_end[:max(at_end.size - np.count_nonzero(requests == end), 0)])
+    return np.sort(np.concatenate(visits))
+
+
+def from_sequence(algorithm, sequence, movement, requests, start, direction, max_cylinder):
+    # Packs a (sequence, movement) pair from any algorithm into a ScheduleResult. Algorithms
+    # that never see max_cylinder (LOOK-like, SSTF) cannot make end-of-disk visits.
+    entry = get(algorithm)
+    with phase("compute.pack"):
+        values = np.asarray(sequence, dtype=np.int64)
+        lowest = min(start, int(values.min())) if values.size else start
+        highest = max(start, int(values.max())) if values.size else start
+        positions = np.empty(values.size + 1, dtype=_buffer_dtype(lowest, highest))
+        positions[0] = start
+        positions[1:] = values
+    with phase("compute.markers"):
+        wraps = _wrap_steps(positions, direction, entry.circular)
+        end_visits = _end_visits(requests, positions[1:], max_cylinder) if entry.uses_max_cylinder else ()
+        reversals = _reversals(positions, wraps)
+    return _record(ScheduleResult(
+        algorithm, positions, movement, start, direction, max_cylinder, end_visits, wraps, reversals
+    ))
+
+
+def _pack(algorithm, segments, start, direction, max_cylinder):
+    # Writes the vectorized engine's pieces straight into the buffer; pieces flagged as not
+    # servicing a request are the end-of-disk visits
+    with phase("compute.service"):
+        # Every piece is sorted one way or the other, so its ends bound its values
+        ends = [start] + [int(values[i]) for values, _ in segments if values.size for i in (0, -1)]
+        positions = np.empty(1 + sum(values.size for values, _ in segments), dtype=_buffer_dtype(min(ends), max(ends)))
+        positions[0] = start
+        end_visits = []
+        offset = 1
+        for values, is_request in segments:
+            positions[offset:offset + values.size] = values
+            if not is_request:
+                end_visits.append(offset - 1)
+            offset += values.size
+        movement = int(np.abs(np.diff(positions)).sum())
+    with phase("compute.markers"):
+        wraps = _wrap_steps(positions, direction, get(algorithm).circular)
+        reversals = _reversals(positions, wraps)
+    return _record(ScheduleResult(
+        algorithm, positions, movement, start, direction, max_cylinder, end_visits, wraps, reversals
+    ))
+
+
+def _from_segments(algorithm, ordered, start, direction, max_cylinder):
+    # SCAN-family result from the sorted requests
+    with phase("compute.partition"):
+        segments = service_segments(ordered, start, direction, max_cylinder, algorithm)
+    return _pack(algorithm, segments, start, direction, max_cylinder)
+
+
+def _from_batches(algorithm, batches, start, direction, max_cylinder):
+    # Batched SCAN variant (N-step SCAN, FSCAN): each non-empty batch is one SCAN sweep from
+    # where the previous one stopped, in the opposite direction, as in nstep_scan.scan_batches
+    segments = []
+    current = start
+    sweep = direction
+    for batch in batches:
+        if not len(batch):
+            continue                            # An empty queue needs no sweep
+        with phase("compute.sort"):
+            ordered = np.sort(np.asarray(batch, dtype=np.int64))
+        with phase("compute.partition"):
+            swept = service_segments(ordered, current, sweep, max_cylinder, "SCAN")
+        segments.extend(swept)
+        current = int(next(values[-1] for values, _ in reversed(swept) if values.size))
+        sweep = 'left' if sweep == 'right' else 'right'
+    return _pack(algorithm, segments, start, direction, max_cylinder)
+
+
+def schedule(algorithm, requests, start, direction, max_cylinder):
+    # Runs a registered algorithm and returns its ScheduleResult. SCAN, C-SCAN, LOOK and
+    # C-LOOK are built by the vectorized engine without an intermediate Python list, and so
+    # is every sweep of the batched variants. The remaining pure-Python algorithms sort and
+    # loop internally, so their whole run counts as service.
+    if algorithm in ALGORITHMS:
+        with phase("compute.sort"):
+            ordered = np.sort(np.asarray(requests, dtype=np.int64))
+        return _from_segments(algorithm, ordered, start, direction, max_cylinder)
+    batches = get(algorithm).batches
+    if batches is not None:
+        return _from_batches(algorithm, batches(requests), start, direction, max_cylinder)
+    listed = requests.tolist() if isinstance(requests, np.ndarray) else list(requests)
+    with phase("compute.service"):
+        sequence, movement = run(algorithm, listed, start, direction, max_cylinder)
+    return from_sequence(algorithm, sequence, movement, requests, start, direction, max_cylinder)
+
+
+def schedule_all(requests, start, direction, max_cylinder, algorithms=None):
+    # ScheduleResults for several algorithms (every registered one by default), sharing a
+    # single sort across the SCAN family. Returns a dict in the order given.
+    algorithms = names() if algorithms is None else algorithms
+    with phase("compute.sort"):
+        ordered = np.sort(np.asarray(requests, dtype=np.int64))
+    results = {}
+    for algorithm in algorithms:
+        if algorithm in ALGORITHMS:
+            results[algorithm] = _from_segments(algorithm, ordered, start, direction, max_cylinder)
+        else:
+            results[algorithm] = schedule(algorithm, requests, start, direction, max_cylinder)
+    return results
@@ -0,0 +1,372 @@
+import argparse                     # Import argparse for the serve / load commands
+import asyncio                      # Import asyncio for the event loop, server and load generator
+import json                         # Import json for request and response bodies
+import os                           # Import os to size the worker pool
+import random                       # Import random for load-generator workloads
+import time                         # Import time for latency measurements
+from collections import deque       # Import deque for bounded latency / batch-size windows
+from concurrent.futures import ProcessPoolExecutor  # Import process pool for CPU-bound scheduling
+import numpy as np                  # Import NumPy for percentile summaries
+from cache import LRUCache, make_key, schedule_size     # Bounded result cache
+from registry import names          # Registered algorithm names
+from result import schedule_all     # Compact schedules sharing one sort per request set
+from traces import validate_requests    # Same range checks as the UI
+from instrument import recording    # Opt-in phase timers for profiled batches
+
+# Samples kept for the latency and batch-size percentiles in /metrics
+METRICS_WINDOW = 10000
+# Largest accepted request body
+MAX_BODY_BYTES = 64 * 1024 * 1024
+
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+               500: "Internal Server Error"}
+
+
+def _run_batch(jobs, profile=False):
+    # Runs in a worker process: each job is (requests, start, direction, max_cylinder,
+    # algorithms) and gets every requested algorithm from a single shared sort.
+    # Returns (results, instrumentation metrics of the batch or None).
+    if not profile:
+        return [schedule_all(*job) for job in jobs], None
+    with recording() as recorder:
+        results = [schedule_all(*job) for job in jobs]
+    return results, recorder.metrics()
+
+
+def _percentiles(samples):
+    # p50/p95/p99/max of a sample window, 0 when empty
+    if not samples:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    p50, p95, p99 = np.percentile(np.fromiter(samples, dtype=np.float64), (50, 95, 99))
+    return {"p50": float(p50), "p95": float(p95), "p99": float(p99), "max": float(max(samples))}
+
+
+def parse_job(body):
+    # Validates a /schedule body and returns (requests, start, direction, max_cylinder,
+    # algorithms, include_sequence, profile). Raises ValueError with a client-facing message.
+    try:
+        payload = json.loads(body)
+        requests = np.asarray(payload["requests"])
+        if requests.ndim != 1 or (requests.size and requests.dtype.kind not in "iu"):
+            raise ValueError("requests must be a list of integers")
+        requests = requests.astype(np.int64, copy=False)
+        start = int(payload["start"])
+        max_cylinder = int(payload["max_cylinder"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid request body: {e}")
+    direction = payload.get("direction", "right")
+    if direction not in ("right", "left"):
+        raise ValueError("direction must be 'right' or 'left'")
+    algorithm = payload.get("algorithm", "all")
+    algorithms = tuple(names()) if algorithm == "all" else (algorithm,)
+    if algorithms[0] not in names():
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    if not 0 <= start <= max_cylinder:
+        raise ValueError(f"Initial head position must be between 0 and {max_cylinder}")
+    validate_requests(requests, max_cylinder)
+    return (requests, start, direction, max_cylinder, algorithms,
+            bool(payload.get("include_sequence", True)), bool(payload.get("profile", False)))
+
+
+class SimulationService:
+    # Local scheduling service. Incoming jobs first hit the LRU cache; misses wait in a queue
+    # from which a batcher collects up to max_batch jobs (or whatever arrives within
+    # max_delay_ms) once a worker is free. Identical request sets in a batch are computed
+    # once for the union of their algorithms, and the batch runs in the process pool so the
+    # event loop never blocks on scheduling.
+
+    def __init__(self, workers=None, max_batch=32, max_delay_ms=2.0, cache=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000.0
+        self.cache = cache or LRUCache(max_entries=1024, max_bytes=512 * 1024 * 1024, sizeof=schedule_size)
+        self.queue = None
+        self.pool = None
+        self._batcher = None
+        self.latencies = deque(maxlen=METRICS_WINDOW)       # End-to-end ms per /schedule call
+        self.batch_sizes = deque(maxlen=METRICS_WINDOW)     # Jobs per dispatched batch
+        self.counters = {"requests": 0, "errors": 0, "cache_hits": 0, "batches": 0,
+                         "computed": 0, "coalesced": 0, "in_flight_batches": 0, "max_queue_depth": 0}
+        self.started = time.monotonic()
+
+    async def start(self, host="127.0.0.1", port=8765):
+        # Starts the worker pool, the batcher and the HTTP server; returns the asyncio server
+        self.queue = asyncio.Queue()
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        self._slots = asyncio.Semaphore(self.workers)       # One batch in flight per worker
+        self._batcher = asyncio.create_task(self._batch_loop())
+        return await asyncio.start_server(self._handle_connection, host, port)
+
+    def close(self):
+        # Stops the batcher and shuts the worker pool down
+        if self._batcher:
+            self._batcher.cancel()
+        if self.pool:
+            self.pool.shutdown(cancel_futures=True)
+
+    async def schedule(self, requests, start, direction, max_cylinder, algorithms, profile=False):
+        # Returns ({algorithm: ScheduleResult}, profile), from the cache where possible. The
+        # request set is hashed once; per-algorithm cache keys extend that group key. With
+        # profile=True the batch that computed the misses is instrumented and its metrics
+        # returned (None when everything came from the cache).
+        group = make_key(requests, start, direction, max_cylinder, "")
+        keys = {name: f"{group}|{name}" for name in algorithms}
+        results = {}
+        for name, key in keys.items():
+            cached = self.cache.get(key)
+            if cached is not None:
+                results[name] = cached
+        self.counters["cache_hits"] += len(results)
+        missing = tuple(name for name in algorithms if name not in results)
+        metrics = None
+        if missing:
+            future = asyncio.get_running_loop().create_future()
+            await self.queue.put((group, (requests, start, direction, max_cylinder), missing, profile, future))
+            self.counters["max_queue_depth"] = max(self.counters["max_queue_depth"], self.queue.qsize())
+            computed, metrics = await future
+            for name in missing:
+                self.cache.put(keys[name], computed[name])
+                results[name] = computed[name]
+        return {name: results[name] for name in algorithms}, metrics
+
+    async def _batch_loop(self):
+        # Collects queued jobs into micro-batches and dispatches them as workers free up
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._slots.acquire()                     # Wait for a free worker first so
+            batch = [await self.queue.get()]                # jobs pile up into larger batches
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch:
+                if not self.queue.empty():
+                    batch.append(self.queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            asyncio.create_task(self._dispatch(batch))
+
+    async def _dispatch(self, batch):
+        # Coalesces identical request sets, runs the batch in the pool and resolves each job
+        groups = {}                                         # group key -> (params, algorithms, futures)
+        profile = False
+        for group, params, algorithms, wants_profile, future in batch:
+            profile = profile or wants_profile
+            if group in groups:
+                self.counters["coalesced"] += 1
+                groups[group][1].update(algorithms)
+                groups[group][2].append(future)
+            else:
+                groups[group] = (params, set(algorithms), [future])
+        jobs = [params + (tuple(sorted(algorithms, key=names().index)),) for params, algorithms, _ in groups.values()]
+        self.counters["batches"] += 1
+        self.counters["computed"] += len(jobs)
+        self.counters["in_flight_batches"] += 1
+        self.batch_sizes.append(len(batch))
+        try:
+            results, metrics = await asyncio.get_running_loop().run_in_executor(self.pool, _run_batch, jobs, profile)
+        except Exception as e:
+            for _, _, futures in groups.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+        else:
+            for (_, _, futures), computed in zip(groups.values(), results):
+                for future in futures:
+                    if not future.done():
+                        future.set_result((computed, metrics))
+        finally:
+            self.counters["in_flight_batches"] -= 1
+            self._slots.release()
+
+    def metrics(self):
+        # Queue depth, batching, cache and latency figures for /metrics
+        return {
+            "uptime_s": time.monotonic() - self.started,
+            "workers": self.workers,
+            "queue_depth": self.queue.qsize() if self.queue else 0,
+            **self.counters,
+            "mean_batch_size": float(np.mean(self.batch_sizes)) if self.batch_sizes else 0.0,
+            "latency_ms": _percentiles(self.latencies),
+            "cache": self.cache.stats(),
+        }
+
+    async def _route(self, method, path, body):
+        # Returns (status, payload) for one HTTP request
+        if path == "/health":
+            return 200, {"status": "ok"}
+        if path == "/metrics":
+            return 200, self.metrics()
+        if path != "/schedule":
+            return 404, {"error": f"Unknown path: {path}"}
+        if method != "POST":
+            return 405, {"error": "Use POST for /schedule"}
+        started = time.perf_counter()
+        self.counters["requests"] += 1
+        try:
+            requests, start, direction, max_cylinder, algorithms, include_sequence, profile = parse_job(body)
+        except ValueError as e:
+            self.counters["errors"] += 1
+            return 400, {"error": str(e)}
+        try:
+            results, metrics = await self.schedule(requests, start, direction, max_cylinder, algorithms, profile)
+        except Exception as e:
+            # A failed batch (e.g. a worker process died) must not drop the connection
+            self.counters["errors"] += 1
+            return 500, {"error": f"Scheduling failed: {e}"}
+        payload = {
+            name: {"movement": result.movement, **({"sequence": result.tolist()} if include_sequence else {})}
+            for name, result in results.items()
+        }
+        if profile:
+            payload["profile"] = metrics if metrics is not None else {"cached": True}
+        self.latencies.append((time.perf_counter() - started) * 1000.0)
+        return 200, payload
+
+    async def _handle_connection(self, reader, writer):
+        # Minimal HTTP/1.1 with keep-alive: one JSON response per request on the connection
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY_BYTES:
+                    status, payload = 413, {"error": "Request body too large"}
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    status, payload = await self._route(method, path.split("?", 1)[0], body)
+                data = json.dumps(payload).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} {STATUS_TEXT[status]}\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close" or status == 413:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass                                            # Client went away or sent garbage
+        finally:
+            writer.close()
+
+
+async def serve(host, port, workers=None, max_batch=32, max_delay_ms=2.0):
+    # Runs the service until interrupted
+    service = SimulationService(workers, max_batch, max_delay_ms)
+    server = await service.start(host, port)
+    print(f"Serving on http://{host}:{port} with {service.workers} workers "
+          f"(POST /schedule, GET /metrics, GET /health)")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+async def _http(reader, writer, method, path, payload=None):
+    # Sends one keep-alive request and returns (status, decoded JSON body)
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":")[1])
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def load(host, port, clients=16, calls=50, size=1000, distinct=8, max_cylinder=9999,
+               algorithm="all", include_sequence=False, seed=0):
+    # Load generator: `clients` concurrent keep-alive connections each send `calls` /schedule
+    # requests drawn from `distinct` random request sets (repeats exercise the cache and
+    # coalescing). Returns the client-side summary plus the server's /metrics.
+    rng = random.Random(seed)
+    workloads = [{
+        "requests": [rng.randint(0, max_cylinder) for _ in range(size)],
+        "start": rng.randint(0, max_cylinder),
+        "direction": rng.choice(("right", "left")),
+        "max_cylinder": max_cylinder,
+        "algorithm": algorithm,
+        "include_sequence": include_sequence,
+    } for _ in range(distinct)]
+    latencies = []
+    failures = 0
+
+    async def client(index):
+        nonlocal failures
+        reader, writer = await asyncio.open_connection(host, port)
+        picker = random.Random(seed + index + 1)
+        try:
+            for _ in range(calls):
+                started = time.perf_counter()
+                status, _ = await _http(reader, writer, "POST", "/schedule", picker.choice(workloads))
+                latencies.append((time.perf_counter() - started) * 1000.0)
+                failures += status != 200
+        finally:
+            writer.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client(i) for i in range(clients)))
+    elapsed = time.perf_counter() - started
+    reader, writer = await asyncio.open_connection(host, port)
+    _, server_metrics = await _http(reader, writer, "GET", "/metrics")
+    writer.close()
+    return {
+        "calls": len(latencies),
+        "failures": failures,
+        "seconds": elapsed,
+        "calls_per_s": len(latencies) / elapsed if elapsed else 0.0,
+        "latency_ms": _percentiles(latencies),
+        "server": server_metrics,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local disk scheduling service and load generator.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve_parser = commands.add_parser("serve", help="Run the HTTP/JSON service")
+    serve_parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    serve_parser.add_argument("--max-batch", type=int, default=32, help="Most jobs per micro-batch")
+    serve_parser.add_argument("--max-delay-ms", type=float, default=2.0,
+                              help="How long a batch waits for more jobs once a worker is free")
+    load_parser = commands.add_parser("load", help="Drive a running service with concurrent clients")
+    load_parser.add_argument("--clients", type=int, default=16)
+    load_parser.add_argument("--calls", type=int, default=50, help="Requests per client")
+    load_parser.add_argument("--size", type=int, default=1000, help="Disk requests per call")
+    load_parser.add_argument("--distinct", type=int, default=8, help="Distinct request sets to draw from")
+    load_parser.add_argument("--algorithm", default="all", choices=names() + ["all"])
+    load_parser.add_argument("--include-sequence", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        try:
+            asyncio.run(serve(args.host, args.port, args.workers, args.max_batch, args.max_delay_ms))
+        except KeyboardInterrupt:
+            pass
+        return 0
+    summary = asyncio.run(load(args.host, args.port, args.clients, args.calls, args.size, args.distinct,
+                               algorithm=args.algorithm, include_sequence=args.include_sequence))
+    print(json.dumps(summary, indent=2))
+    return 1 if summary["failures"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
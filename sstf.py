@@ -0,0 +1,36 @@
+from bisect import bisect_left      # Binary search for the requests nearest the start
+
+
+def run_sstf(requests, start, direction):
+    # Sort the incoming disk requests in ascending order
+    requests = sorted(requests)
+    # Initialize total head movement to 0
+    movement = 0
+    # Initialize the sequence of serviced requests
+    sequence = []
+    # Set the current head position to the start value
+    current = start
+    # Ties between equally close requests follow the direction the head last moved in
+    moving_right = direction == 'right'
+
+    # Serviced requests always form one contiguous block of the sorted list around the start,
+    # so the nearest pending request is either just below (lo) or just above (hi) that block
+    hi = bisect_left(requests, start)   # First request >= start
+    lo = hi - 1                         # Last request < start
+    while lo >= 0 or hi < len(requests):
+        down = current - requests[lo] if lo >= 0 else None
+        up = requests[hi] - current if hi < len(requests) else None
+        if up is not None and (down is None or up < down or (up == down and moving_right)):
+            r = requests[hi]            # Closest request is above the head
+            hi += 1
+        else:
+            r = requests[lo]            # Closest request is below the head
+            lo -= 1
+        if r != current:
+            moving_right = r > current  # Remember the direction of travel for tie-breaking
+        sequence.append(r)              # Add request to the sequence
+        movement += abs(current - r)    # Add movement distance
+        current = r                     # Move head to current request
+
+    # Return the service sequence and the total movement
+    return sequence, movement
@@ -0,0 +1,68 @@
+import os                           # Import os to recognise trace file paths
+import numpy as np                  # Import NumPy for memory-mapped traces and chunked arithmetic
+from batch import service_segments  # Reuse the vectorized engine's service order
+
+# Number of schedule entries materialised at a time while streaming
+CHUNK_SIZE = 1 << 16
+
+
+def open_trace(path, dtype=np.int64):
+    # Memory-maps a raw binary trace of int32/int64 cylinder numbers without reading it
+    return np.memmap(path, dtype=dtype, mode='r')
+
+
+def _sorted_requests(requests, scratch=None, chunk_size=CHUNK_SIZE, dtype=np.int64):
+    # Returns the requests in ascending order. With a scratch path the sort happens in a
+    # memory-mapped file, so the sorted copy lives on disk rather than in RAM.
+    # dtype is the element type of a binary trace path (int32 or int64).
+    if isinstance(requests, (str, os.PathLike)):
+        requests = open_trace(requests, dtype)
+    if scratch is None:
+        return np.sort(np.asarray(requests, dtype=np.int64))
+    ordered = np.memmap(scratch, dtype=np.int64, mode='w+', shape=(len(requests),))
+    for offset in range(0, len(requests), chunk_size):
+        ordered[offset:offset + chunk_size] = requests[offset:offset + chunk_size]
+    ordered.sort()
+    return ordered
+
+
+def stream_schedule(requests, start, direction, max_cylinder, algorithm, scratch=None, chunk_size=CHUNK_SIZE,
+                    dtype=np.int64):
+    # Lazily yields (cylinder, cumulative_movement) for every stop of SCAN, C-SCAN, LOOK or
+    # C-LOOK. requests may be a list, a NumPy array, a numpy.memmap or a binary trace path
+    # of `dtype` values.
+    ordered = _sorted_requests(requests, scratch, chunk_size, dtype)
+    current = start
+    total = 0
+    for values, _ in service_segments(ordered, start, direction, max_cylinder, algorithm):
+        for offset in range(0, len(values), chunk_size):
+            chunk = np.asarray(values[offset:offset + chunk_size], dtype=np.int64)
+            cumulative = total + np.cumsum(np.abs(np.diff(chunk, prepend=current)))
+            yield from zip(chunk.tolist(), cumulative.tolist())
+            current = int(chunk[-1])                # Carry head position into the next chunk
+            total = int(cumulative[-1])             # Carry running movement into the next chunk
+
+
+def collect_schedule(stream):
+    # Drains a stream into the (sequence, movement) tuple returned by the run_* functions
+    sequence = []
+    movement = 0
+    for cylinder, movement in stream:
+        sequence.append(cylinder)
+    return sequence, movement
+
+
+def write_schedule(stream, path, dtype=np.int64, chunk_size=CHUNK_SIZE):
+    # Writes the cylinders of a stream to a raw binary file in constant memory.
+    # Returns the total head movement.
+    movement = 0
+    buffer = []
+    with open(path, 'wb') as f:
+        for cylinder, movement in stream:
+            buffer.append(cylinder)
+            if len(buffer) == chunk_size:
+                np.asarray(buffer, dtype=dtype).tofile(f)
+                buffer.clear()
+        if buffer:
+            np.asarray(buffer, dtype=dtype).tofile(f)
+    return movement
@@ -0,0 +1,87 @@
+import os                                           # Import os to size the worker pool
+from concurrent.futures import ProcessPoolExecutor  # Import process pool for parallel sweeps
+import numpy as np                                  # Import NumPy for the vectorized grid
+from movement import movement_from_bounds           # Closed-form movement per configuration
+from instrument import timed                        # Opt-in phase timer
+
+# Algorithms and directions covered by a sweep, in grid order
+ALGORITHMS = ("SCAN", "C-SCAN", "LOOK", "C-LOOK")
+DIRECTIONS = ("right", "left")
+
+# Start positions evaluated per task
+CHUNK_SIZE = 4096
+
+# Sorted requests shared by every task in a worker process
+_ordered = None
+
+
+def _init_worker(ordered):
+    # Runs once per worker process so the request array is not re-sent with every task
+    global _ordered
+    _ordered = ordered
+
+
+def _side_bounds(ordered, starts, direction):
+    # Vectorized side bounds for many start positions at once via searchsorted
+    n = ordered.size
+    if not n:
+        zeros = np.zeros(starts.shape, dtype=np.int64)
+        empty = np.zeros(starts.shape, dtype=bool)
+        return zeros, zeros, empty, zeros, zeros, empty
+    # Right: requests >= start are on the high side; left: requests <= start are on the low side
+    split = np.searchsorted(ordered, starts, side='left' if direction == 'right' else 'right')
+    has_lo = split > 0
+    has_hi = split < n
+    lo_min = np.full(starts.shape, ordered[0])
+    lo_max = ordered[np.maximum(split - 1, 0)]
+    hi_min = ordered[np.minimum(split, n - 1)]
+    hi_max = np.full(starts.shape, ordered[-1])
+    return lo_min, lo_max, has_lo, hi_min, hi_max, has_hi
+
+
+def _sweep_chunk(starts, max_cylinders, algorithms, ordered=None):
+    # Movement for one chunk of start positions across every algorithm, direction and
+    # max_cylinder. Returns an array shaped (algorithms, starts, directions, max_cylinders).
+    ordered = _ordered if ordered is None else ordered
+    starts = np.asarray(starts, dtype=np.int64)
+    grid = np.empty((len(algorithms), starts.size, len(DIRECTIONS), len(max_cylinders)), dtype=np.int64)
+    highest = int(ordered[-1]) if ordered.size else 0
+    for d, direction in enumerate(DIRECTIONS):
+        bounds = _side_bounds(ordered, starts, direction)
+        for m, max_cylinder in enumerate(max_cylinders):
+            for a, algorithm in enumerate(algorithms):
+                grid[a, :, d, m] = movement_from_bounds(algorithm, direction, starts, max_cylinder, *bounds)
+            # Configurations where the start or a request lies beyond the disk are invalid
+            invalid = starts > max_cylinder if highest <= max_cylinder else np.ones(starts.size, dtype=bool)
+            grid[:, invalid, d, m] = -1
+    return grid
+
+
+@timed("compute.sweep")
+def sweep(requests, starts=None, max_cylinders=None, algorithms=ALGORITHMS, workers=None, chunk_size=CHUNK_SIZE):
+    # Total head movement for every (algorithm, start, direction, max_cylinder) combination.
+    # Start positions are split into chunks and fanned out over a process pool; a single
+    # chunk runs in-process. Returns an int64 array shaped
+    # (len(algorithms), len(starts), len(DIRECTIONS), len(max_cylinders)); invalid
+    # configurations (start or requests beyond max_cylinder) hold -1.
+    ordered = np.sort(np.asarray(requests, dtype=np.int64))
+    if max_cylinders is None:
+        max_cylinders = [int(ordered[-1]) if ordered.size else 0]
+    max_cylinders = [int(m) for m in max_cylinders]
+    if starts is None:
+        starts = np.arange(max(max_cylinders) + 1)
+    starts = np.asarray(starts, dtype=np.int64)
+    chunks = [starts[i:i + chunk_size] for i in range(0, starts.size, chunk_size)]
+
+    if len(chunks) <= 1 or workers == 1:
+        parts = [_sweep_chunk(chunk, max_cylinders, algorithms, ordered) for chunk in chunks]
+    else:
+        workers = min(workers or os.cpu_count() or 1, len(chunks))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(ordered,)) as pool:
+            parts = list(pool.map(
+                _sweep_chunk, chunks,
+                [max_cylinders] * len(chunks), [tuple(algorithms)] * len(chunks)
+            ))
+    if not parts:
+        return np.empty((len(algorithms), 0, len(DIRECTIONS), len(max_cylinders)), dtype=np.int64)
+    return np.concatenate(parts, axis=1)
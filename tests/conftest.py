@@ -0,0 +1,6 @@
+import os                           # Import os to locate the repository root
+import sys                          # Import sys to make the top-level modules importable
+
+# The modules live flat in the repository root, so put it on the path when pytest is run
+# from anywhere else
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
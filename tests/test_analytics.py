@@ -0,0 +1,41 @@
+import numpy as np                  # Import NumPy for expected values
+import pytest                       # Import pytest for approximate comparisons
+from analytics import analyze, band_fairness, request_waits, wait_stats
+from timing import DiskModel, algorithm_timing
+
+
+def test_waits_skip_end_of_disk_visits():
+    # SCAN right from 100: 150 (50), end visit at 199, 80 (50 + 49 + 119), 20 (+60)
+    cylinders, waits = request_waits([20, 150, 80], 100, 'right', 199, "SCAN")
+    assert cylinders.tolist() == [150, 80, 20]
+    assert waits.tolist() == [50, 218, 278]
+
+
+def test_timed_waits_match_algorithm_timing():
+    requests = [20, 150, 80, 199, 0]
+    _, waits = request_waits(requests, 100, 'left', 199, "C-SCAN", DiskModel())
+    expected = algorithm_timing(requests, 100, 'left', 199, "C-SCAN", DiskModel())["completion_ms"]
+    assert waits == pytest.approx(expected)
+
+
+def test_wait_stats():
+    stats = wait_stats([10, 20, 30, 40])
+    assert stats["p50"] == pytest.approx(25.0)
+    assert stats["max"] == 40.0 and stats["mean"] == 25.0 and stats["variance"] == 125.0
+    assert wait_stats([]) == {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0, "mean": 0.0, "variance": 0.0}
+
+
+def test_band_fairness():
+    fairness = band_fairness([5, 15, 95, 99], np.array([10.0, 10.0, 30.0, 50.0]), 99, bands=10)
+    assert fairness["counts"].tolist() == [1, 1, 0, 0, 0, 0, 0, 0, 0, 2]
+    assert fairness["mean_wait"][[0, 1, 9]].tolist() == [10.0, 10.0, 40.0]
+    assert fairness["jain_index"] == pytest.approx(60.0 ** 2 / (3 * (100 + 100 + 1600)))
+    assert band_fairness([5, 50], np.array([7.0, 7.0]), 99)["jain_index"] == pytest.approx(1.0)
+
+
+def test_analyze_report():
+    report = analyze([10, 90, 40], 50, 'right', 99, "LOOK", bands=2)
+    assert report["cylinders"].tolist() == [90, 40, 10]
+    assert report["waits"].tolist() == [40, 90, 120]
+    assert report["stats"]["max"] == 120.0
+    assert report["fairness"]["counts"].tolist() == [2, 1]
@@ -0,0 +1,53 @@
+import json                         # Import json to write a baseline file
+import numpy as np                  # Import NumPy for the workload generator
+import pytest                       # Import pytest for parametrized cases
+import bench                        # Module whose run_benchmarks the gate test replaces
+from bench import DISTRIBUTIONS, compare_to_baseline, main, make_requests
+
+
+@pytest.mark.parametrize("distribution", DISTRIBUTIONS)
+def test_workloads_stay_on_the_disk(distribution):
+    requests = make_requests(distribution, 1000, 999, 500, np.random.default_rng(0))
+    assert requests.shape == (1000,)
+    assert requests.min() >= 0 and requests.max() <= 999
+
+
+def test_unknown_distribution_is_rejected():
+    with pytest.raises(ValueError):
+        make_requests("bursty", 10, 99, 0, np.random.default_rng(0))
+
+
+def record(seconds, engine="vectorized"):
+    return {"engine": engine, "algorithm": "SCAN", "distribution": "uniform", "size": 1000, "seconds": seconds}
+
+
+def test_compare_to_baseline_flags_slowdowns_beyond_tolerance():
+    baseline = {"results": [record(1.0), record(1.0, "reference")]}
+    regressions = compare_to_baseline([record(1.1), record(1.5, "reference")], baseline, 0.2)
+    assert [(r["engine"], r["ratio"]) for r in regressions] == [("reference", 1.5)]
+    assert compare_to_baseline([record(9.0, "movement_only")], baseline, 0.2) == []
+
+
+def test_compare_to_baseline_ignores_slowdowns_below_min_delta():
+    baseline = {"results": [record(0.001)]}
+    assert compare_to_baseline([record(0.002)], baseline, 0.2, min_delta=0.005) == []
+    assert len(compare_to_baseline([record(0.002)], baseline, 0.2, min_delta=0.0005)) == 1
+
+
+def test_default_min_delta_catches_fast_regressions(tmp_path, monkeypatch):
+    # A 0.1 ms case running twice as slow must fail the gate with the default threshold
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"results": [record(0.0001)]}))
+    monkeypatch.setattr(bench, "run_benchmarks", lambda *args: [record(0.0002)])
+    assert main(["--baseline", str(baseline)]) == 1
+    monkeypatch.setattr(bench, "run_benchmarks", lambda *args: [record(0.000105)])
+    assert main(["--baseline", str(baseline)]) == 0
+
+
+def test_main_writes_report_and_passes_against_itself(tmp_path):
+    out = tmp_path / "bench.json"
+    args = ["--sizes", "50", "--distributions", "uniform", "--repeat", "1"]
+    assert main(args + ["--out", str(out)]) == 0
+    report = json.loads(out.read_text())
+    assert {r["engine"] for r in report["results"]} >= {"reference", "vectorized", "movement_only"}
+    assert main(args + ["--baseline", str(out), "--tolerance", "1000"]) == 0
@@ -0,0 +1,58 @@
+import numpy as np                  # Import NumPy to build request arrays
+from cache import LRUCache, make_key, schedule_size
+
+
+def test_evicts_least_recently_used_entry():
+    cache = LRUCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1                  # "a" becomes the most recently used
+    cache.put("c", 3)
+    assert "b" not in cache and "a" in cache and "c" in cache
+    assert cache.stats() == {"entries": 2, "bytes": 0, "hits": 1, "misses": 0}
+
+
+def test_evicts_by_size_and_tracks_bytes():
+    cache = LRUCache(max_entries=10, max_bytes=100, sizeof=len)
+    cache.put("a", "x" * 60)
+    cache.put("b", "x" * 30)
+    cache.put("a", "x" * 50)                    # Replacing an entry releases its old size
+    assert cache.stats()["bytes"] == 80
+    cache.put("c", "x" * 40)                    # Over budget: "b" is now the oldest entry
+    assert "b" not in cache and len(cache) == 2
+    assert cache.stats()["bytes"] == 90
+    cache.put("huge", "x" * 500)                # Larger than the whole budget: nothing fits
+    assert len(cache) == 0 and cache.stats()["bytes"] == 0
+
+
+def test_get_or_compute_caches_none_and_counts_misses():
+    cache = LRUCache()
+    calls = []
+    compute = lambda: calls.append(1)           # Returns None
+    assert cache.get_or_compute("k", compute) is None
+    assert cache.get_or_compute("k", compute) is None
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.evict("k")
+    assert "k" not in cache
+    cache.clear()
+    assert cache.stats() == {"entries": 0, "bytes": 0, "hits": 0, "misses": 0}
+
+
+def test_make_key_depends_on_every_input():
+    base = make_key([1, 2, 3], 0, "right", 199, "SCAN")
+    assert base == make_key(np.array([1, 2, 3], dtype=np.int32), 0, "right", 199, "SCAN")
+    variants = [
+        make_key([1, 2, 4], 0, "right", 199, "SCAN"),
+        make_key([1, 2, 3], 1, "right", 199, "SCAN"),
+        make_key([1, 2, 3], 0, "left", 199, "SCAN"),
+        make_key([1, 2, 3], 0, "right", 200, "SCAN"),
+        make_key([1, 2, 3], 0, "right", 199, "LOOK"),
+    ]
+    assert len({base, *variants}) == 6
+
+
+def test_schedule_size_estimates():
+    assert schedule_size(np.zeros(10, dtype=np.int64)) == 80
+    assert schedule_size(([1, 2, 3], 42)) == 24 + 8
+    assert schedule_size({"SCAN": ([1, 2], 3), "LOOK": (np.zeros(4, dtype=np.int32), 5)}) == 24 + 24
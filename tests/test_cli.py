@@ -0,0 +1,98 @@
+import io                           # Import io to fake stdin
+import json                         # Import json to read the output
+import os                           # Import os to locate the repository root
+import subprocess                   # Import subprocess to check imports in a fresh interpreter
+import sys                          # Import sys for the interpreter path
+import numpy as np                  # Import NumPy to write binary traces
+import pytest                       # Import pytest for expected exits
+from cli import main
+from registry import names, run
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_cli(capsys, argv, stdin=None, monkeypatch=None):
+    # Runs the CLI in-process and returns its stdout
+    if stdin is not None:
+        monkeypatch.setattr(sys, "stdin", io.StringIO(stdin))
+    assert main(argv) == 0
+    return capsys.readouterr().out
+
+
+def test_single_algorithm_from_stdin(capsys, monkeypatch):
+    out = run_cli(capsys, ["-a", "SCAN", "-s", "50", "-m", "99"], "10, 90\n40 ", monkeypatch)
+    assert json.loads(out) == {"algorithm": "SCAN", "start": 50, "direction": "right", "max_cylinder": 99,
+                               "movement": 138, "sequence": [90, 99, 40, 10]}
+
+
+def test_all_algorithms_from_file_match_registry(capsys, tmp_path):
+    path = tmp_path / "requests.txt"
+    path.write_text("98 183 37 122 14 124 65 67")
+    records = json.loads(run_cli(capsys, [str(path), "-s", "53", "-d", "left", "-m", "199"]))
+    assert [r["algorithm"] for r in records] == names()
+    requests = [98, 183, 37, 122, 14, 124, 65, 67]
+    for r in records:
+        assert (r["sequence"], r["movement"]) == run(r["algorithm"], requests, 53, "left", 199)
+
+
+def test_vectorized_and_movement_only_engines(capsys, tmp_path):
+    path = tmp_path / "requests.txt"
+    path.write_text("98,183,37,122,14,124,65,67")
+    base = ["-s", "53", "-m", "199", str(path)]
+    python = json.loads(run_cli(capsys, base))
+    vectorized = json.loads(run_cli(capsys, base + ["--engine", "vectorized"]))
+    totals = json.loads(run_cli(capsys, base + ["--movement-only"]))
+    assert [r["algorithm"] for r in vectorized] == ["SCAN", "C-SCAN", "LOOK", "C-LOOK"]
+    assert vectorized == python[:4]
+    assert [r["movement"] for r in totals] == [r["movement"] for r in python[:4]]
+    assert all("sequence" not in r for r in totals)
+
+
+def test_csv_output_and_binary_trace(capsys, tmp_path):
+    path = tmp_path / "trace.bin"
+    np.array([10, 90, 40], dtype=np.int32).tofile(path)
+    out = run_cli(capsys, [str(path), "-i", "binary32", "-a", "LOOK", "-s", "50", "-m", "99", "-f", "csv"])
+    assert out.splitlines() == ["algorithm,start,direction,max_cylinder,movement,sequence",
+                                "LOOK,50,right,99,120,90 40 10"]
+
+
+def test_invalid_requests_exit_with_usage_error(capsys, monkeypatch):
+    monkeypatch.setattr(sys, "stdin", io.StringIO("5 500"))
+    with pytest.raises(SystemExit) as exit_info:
+        main(["-s", "0", "-m", "100"])
+    assert exit_info.value.code == 2
+    assert "exceed the maximum cylinder" in capsys.readouterr().err
+
+
+def test_geometry_maps_text_and_trace_input(capsys, monkeypatch, tmp_path):
+    argv = ["-a", "LOOK", "-s", "0", "-m", "10", "--geometry", "16", "63", "--no-sequence"]
+    record = json.loads(run_cli(capsys, argv, "1000 2000 5000", monkeypatch))
+    assert record["movement"] == 4                              # Sectors map to cylinders 0, 1, 4
+    path = tmp_path / "trace.bin"
+    np.array([1000, 2000, 5000], dtype=np.int64).tofile(path)
+    assert json.loads(run_cli(capsys, [str(path), "-i", "binary64"] + argv)) == record
+
+
+def test_skip_header_for_text_and_csv(capsys, monkeypatch, tmp_path):
+    argv = ["-a", "SCAN", "-s", "50", "-m", "99", "--skip-header", "--no-sequence"]
+    record = json.loads(run_cli(capsys, argv, "requests\n10 90 40\n", monkeypatch))
+    assert record["movement"] == 138
+    path = tmp_path / "trace.csv"
+    path.write_text("cylinder,x\n10\n90\n40\n")
+    assert json.loads(run_cli(capsys, [str(path), "-i", "csv"] + argv)) == record
+
+
+@pytest.mark.parametrize("start", ["-1", "101"])
+def test_start_outside_the_disk_is_rejected(capsys, monkeypatch, start):
+    monkeypatch.setattr(sys, "stdin", io.StringIO("5 50"))
+    with pytest.raises(SystemExit) as exit_info:
+        main(["-s", start, "-m", "100"])
+    assert exit_info.value.code == 2
+    assert "Initial head position must be between 0 and 100" in capsys.readouterr().err
+
+
+def test_text_run_does_not_import_numpy():
+    code = ("import sys, io; sys.stdin = io.StringIO('3 1 2'); import cli; cli.main(['-s', '0', '-m', '9']);"
+            " sys.stderr.write(str('numpy' in sys.modules))")
+    done = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert done.stderr == "False"
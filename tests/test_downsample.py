@@ -0,0 +1,26 @@
+import numpy as np                  # Import NumPy to build series
+import pytest                       # Import pytest for parametrized cases
+from downsample import minmax_downsample
+
+
+def test_short_series_is_returned_whole():
+    indices, values = minmax_downsample([3, 1, 2], 10)
+    assert indices.tolist() == [0, 1, 2] and values.tolist() == [3, 1, 2]
+
+
+@pytest.mark.parametrize("n, max_points", [(1001, 100), (5000, 7), (10 ** 5, 2000), (37, 4)])
+def test_keeps_extremes_within_budget(n, max_points):
+    y = np.random.default_rng(n).integers(0, 10 ** 6, n)
+    indices, values = minmax_downsample(y, max_points)
+    assert len(indices) <= max_points
+    assert np.all(np.diff(indices) > 0)                     # Ordered and unique
+    assert np.array_equal(values, y[indices])
+    assert indices[0] == 0 and indices[-1] == n - 1
+    assert y.argmax() in indices and y.argmin() in indices
+
+
+def test_sweep_turning_points_survive():
+    # A SCAN-like sawtooth: both turning points must still be drawn
+    y = np.concatenate((np.arange(5000, 10000), [9999], np.arange(4999, -1, -1)))
+    _, values = minmax_downsample(y, 50)
+    assert values.max() == 9999 and values.min() == 0
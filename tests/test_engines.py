@@ -0,0 +1,188 @@
+import random                       # Import random for the randomized workloads
+import numpy as np                  # Import NumPy for the array engines
+import pytest                       # Import pytest for parametrized cases
+from scan import run_scan           # Reference SCAN implementation
+from cscan import run_cscan         # Reference C-SCAN implementation
+from look import run_look           # Reference LOOK implementation
+from clook import run_clook         # Reference C-LOOK implementation
+from batch import (ALGORITHMS, schedule_all_array, schedule_array,      # Vectorized engine
+                   schedule_batch, vector_clook, vector_cscan, vector_look, vector_scan)
+from compare import run_all         # Shared single-sort kernel
+import movement                     # Closed-form movement (CHUNK_SIZE is patched below)
+from movement import movement_only, movements_only
+from stream import collect_schedule, stream_schedule    # Chunked streaming engine
+from sstf import run_sstf           # Two-pointer SSTF
+from compare import run_registered  # Every registered algorithm
+from registry import names, run     # Algorithm registry
+from result import schedule, schedule_all   # ScheduleResult engine
+
+# Pure-Python reference implementations, keyed by algorithm
+REFERENCE = {
+    "SCAN": lambda requests, start, direction, max_cylinder: run_scan(requests, start, direction, max_cylinder),
+    "C-SCAN": lambda requests, start, direction, max_cylinder: run_cscan(requests, start, direction, max_cylinder),
+    "LOOK": lambda requests, start, direction, max_cylinder: run_look(requests, start, direction),
+    "C-LOOK": lambda requests, start, direction, max_cylinder: run_clook(requests, start, direction, max_cylinder),
+}
+
+DIRECTIONS = ("right", "left")
+SEEDS = range(5)
+
+
+def random_cases(seed, count=200):
+    # Request sets covering the awkward spots: empty queues, duplicates, requests and starts
+    # at cylinder 0 or max_cylinder, and tiny disks where almost everything is an end
+    rng = random.Random(seed)
+    for _ in range(count):
+        max_cylinder = rng.choice([0, 1, 2, 10, 199, 4999])
+        size = rng.choice([0, 1, 2, 3, rng.randint(4, 60)])
+        requests = [rng.randint(0, max_cylinder) for _ in range(size)]
+        if requests and rng.random() < 0.3:
+            requests.append(rng.choice([0, max_cylinder]))         # Force a request at an end
+        start = rng.choice([0, max_cylinder, rng.randint(0, max_cylinder)])
+        yield requests, start, rng.choice(DIRECTIONS), max_cylinder
+
+
+def reference_cases(seed):
+    # Every random case paired with each algorithm's reference (sequence, movement)
+    for requests, start, direction, max_cylinder in random_cases(seed):
+        for algorithm in ALGORITHMS:
+            expected = REFERENCE[algorithm](list(requests), start, direction, max_cylinder)
+            yield algorithm, requests, start, direction, max_cylinder, expected
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_vectorized_matches_reference(seed):
+    wrappers = {"SCAN": vector_scan, "C-SCAN": vector_cscan, "C-LOOK": vector_clook}
+    for algorithm, requests, start, direction, max_cylinder, expected in reference_cases(seed):
+        case = (algorithm, requests, start, direction, max_cylinder)
+        sequence, movement = schedule_array(np.array(requests, dtype=np.int64), start, direction, max_cylinder, algorithm)
+        assert (sequence.tolist(), movement) == expected, case
+        if algorithm == "LOOK":
+            sequence, movement = vector_look(requests, start, direction)
+        else:
+            sequence, movement = wrappers[algorithm](requests, start, direction, max_cylinder)
+        assert (sequence.tolist(), movement) == expected, case
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_schedule_batch_matches_reference(seed):
+    rng = random.Random(seed)
+    for algorithm in ALGORITHMS:
+        max_cylinder = rng.choice([10, 199])
+        batch = np.array([[rng.randint(0, max_cylinder) for _ in range(8)] for _ in range(6)])
+        starts = [rng.randint(0, max_cylinder) for _ in range(6)]
+        directions = [rng.choice(DIRECTIONS) for _ in range(6)]
+        sequences, movements = schedule_batch(batch, starts, directions, max_cylinder, algorithm)
+        for row, start, direction, sequence, movement in zip(batch, starts, directions, sequences, movements):
+            expected = REFERENCE[algorithm](row.tolist(), start, direction, max_cylinder)
+            assert (sequence.tolist(), int(movement)) == expected
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_compare_all_matches_reference(seed):
+    for requests, start, direction, max_cylinder in random_cases(seed):
+        shared = run_all(requests, start, direction, max_cylinder)
+        vectorized = schedule_all_array(np.array(requests, dtype=np.int64), start, direction, max_cylinder)
+        assert list(shared) == list(vectorized) == list(ALGORITHMS)
+        for algorithm in ALGORITHMS:
+            case = (algorithm, requests, start, direction, max_cylinder)
+            expected = REFERENCE[algorithm](list(requests), start, direction, max_cylinder)
+            assert shared[algorithm] == expected, case
+            assert (vectorized[algorithm][0].tolist(), vectorized[algorithm][1]) == expected, case
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_movement_only_matches_reference(seed, monkeypatch):
+    monkeypatch.setattr(movement, "CHUNK_SIZE", 7)     # Make arrays span several chunks
+    for requests, start, direction, max_cylinder in random_cases(seed):
+        array = np.array(requests, dtype=np.int64)
+        totals = movements_only(array, start, direction, max_cylinder)
+        assert totals == movements_only(requests, start, direction, max_cylinder)
+        for algorithm in ALGORITHMS:
+            case = (algorithm, requests, start, direction, max_cylinder)
+            _, expected = REFERENCE[algorithm](list(requests), start, direction, max_cylinder)
+            assert movement_only(requests, start, direction, max_cylinder, algorithm) == expected, case
+            assert movement_only(array, start, direction, max_cylinder, algorithm) == expected, case
+            assert totals[algorithm] == expected, case
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_stream_matches_reference(seed):
+    for algorithm, requests, start, direction, max_cylinder, expected in reference_cases(seed):
+        streamed = stream_schedule(requests, start, direction, max_cylinder, algorithm, chunk_size=3)
+        assert collect_schedule(streamed) == expected, (algorithm, requests, start, direction, max_cylinder)
+
+
+def naive_sstf(requests, start, direction):
+    # O(n^2) SSTF: scan every pending request for the closest one. Ties between a request
+    # above and one below the head go the way the head last moved.
+    pending = list(requests)
+    sequence = []
+    movement = 0
+    current = start
+    moving_right = direction == 'right'
+    while pending:
+        best = min(abs(r - current) for r in pending)
+        candidates = [r for r in pending if abs(r - current) == best]
+        r = max(candidates) if moving_right else min(candidates)
+        if r != current:
+            moving_right = r > current
+        pending.remove(r)
+        sequence.append(r)
+        movement += abs(r - current)
+        current = r
+    return sequence, movement
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_sstf_matches_naive(seed):
+    for requests, start, direction, max_cylinder in random_cases(seed):
+        expected = naive_sstf(requests, start, direction)
+        assert run_sstf(requests, start, direction) == expected, (requests, start, direction)
+        assert run("SSTF", requests, start, direction, max_cylinder) == expected
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_run_registered_matches_registry(seed):
+    for requests, start, direction, max_cylinder in random_cases(seed, count=50):
+        results = run_registered(requests, start, direction, max_cylinder)
+        assert list(results) == names()
+        for name in names():
+            assert results[name] == run(name, list(requests), start, direction, max_cylinder), name
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_schedule_results_match_reference(seed):
+    for requests, start, direction, max_cylinder in random_cases(seed):
+        array = np.array(requests, dtype=np.int64)
+        results = schedule_all(array, start, direction, max_cylinder)
+        assert list(results) == names()
+        for name in names():
+            case = (name, requests, start, direction, max_cylinder)
+            expected = run(name, list(requests), start, direction, max_cylinder)
+            for result in (results[name], schedule(name, array, start, direction, max_cylinder)):
+                assert (result.tolist(), result.movement) == expected, case
+            if name in ALGORITHMS:
+                assert int(results[name].is_request.sum()) == len(requests), case
+
+
+def test_batched_scan_marks_only_end_visits():
+    # Three N-step SCAN batches of the default 10: the first sweep ends at the 199 request,
+    # the second runs out to 0 and the third out to 199, and only those two are end visits
+    requests = [199] + [150] * 9 + [120] * 10 + [130] * 10
+    result = schedule("N-step SCAN", requests, 100, 'right', 199)
+    assert (result.tolist(), result.movement) == run("N-step SCAN", requests, 100, 'right', 199)
+    assert result.tolist()[9] == result.tolist()[31] == 199 and result.tolist()[20] == 0
+    assert result.end_visits.tolist() == [20, 31]
+
+
+def test_movement_only_rejects_unknown_algorithm():
+    with pytest.raises(ValueError):
+        movement_only([1, 2], 0, 'right', 10, "ELEVATOR")
+
+
+def test_schedule_batch_rejects_bad_shapes():
+    with pytest.raises(ValueError):
+        schedule_batch(np.arange(4), 0, 'right', 10, "SCAN")
+    with pytest.raises(ValueError):
+        schedule_batch(np.zeros((3, 2), dtype=np.int64), [0, 1], 'right', 10, "SCAN")
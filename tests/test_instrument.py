@@ -0,0 +1,76 @@
+import threading                    # Import threading to check per-thread recording
+import instrument
+from instrument import count, enabled, phase, recording, timed
+from result import schedule
+
+
+def test_hooks_are_no_ops_when_not_recording():
+    assert not enabled()
+    assert phase("compute.sort") is phase("render.figure")     # The shared no-op
+    with phase("compute.sort"):
+        count("requests_served")
+    with recording() as recorder:
+        pass
+    assert recorder.metrics()["phases"] == {} and recorder.metrics()["counters"] == {}
+    assert instrument._active == 0
+
+
+def test_recording_collects_phases_and_counters():
+    with recording() as recorder:
+        assert enabled()
+        with phase("compute.sort"):
+            pass
+        with phase("compute.sort"):
+            pass
+        count("hits", 2)
+        count("hits")
+        count("wraps", group="C-SCAN")
+    metrics = recorder.metrics()
+    assert metrics["phases"]["compute.sort"]["calls"] == 2
+    assert metrics["counters"] == {"all": {"hits": 3}, "C-SCAN": {"wraps": 1}}
+    assert set(metrics["categories_ms"]) == {"compute"}
+    assert not enabled()
+
+
+def test_nested_phases_count_once_per_category():
+    with recording() as recorder:
+        with phase("compute.timing"):
+            with phase("compute.sort"):
+                sum(range(10000))
+    metrics = recorder.metrics()
+    outer = metrics["phases"]["compute.timing"]["wall_ms"]
+    assert metrics["phases"]["compute.sort"]["wall_ms"] <= outer
+    assert metrics["categories_ms"]["compute"] == outer
+
+
+def test_schedule_records_algorithm_counters():
+    with recording() as recorder:
+        schedule("C-SCAN", [10, 90, 40], 50, "right", 99)
+    counters = recorder.metrics()["counters"]["C-SCAN"]
+    assert counters == {"requests_served": 3, "end_of_disk_visits": 2, "wrap_jumps": 1, "direction_reversals": 0}
+
+
+def test_threads_record_separately():
+    seen = []
+
+    def other():
+        seen.append(enabled())
+        with phase("compute.sort"):
+            pass
+
+    with recording() as recorder:
+        thread = threading.Thread(target=other)
+        thread.start()
+        thread.join()
+    assert seen == [False] and recorder.metrics()["phases"] == {}
+
+
+def test_timed_decorator():
+    @timed("render.figure")
+    def build(x):
+        return x * 2
+
+    assert build.__name__ == "build" and build(2) == 4
+    with recording() as recorder:
+        assert build(3) == 6
+    assert recorder.metrics()["phases"]["render.figure"]["calls"] == 1
@@ -0,0 +1,80 @@
+import random                       # Import random for the randomized workloads
+import pytest                       # Import pytest for parametrized cases
+from scan import run_scan           # Reference SCAN implementation
+from cscan import run_cscan         # Reference C-SCAN implementation
+from look import run_look           # Reference LOOK implementation
+from clook import run_clook         # Reference C-LOOK implementation
+from sstf import run_sstf           # Reference SSTF implementation
+from nstep_scan import run_nstep_scan   # Reference N-step SCAN implementation
+from online import simulate
+
+# Pure-Python reference implementations, keyed by policy
+REFERENCE = {
+    "SCAN": lambda requests, start, direction, max_cylinder: run_scan(requests, start, direction, max_cylinder),
+    "C-SCAN": lambda requests, start, direction, max_cylinder: run_cscan(requests, start, direction, max_cylinder),
+    "LOOK": lambda requests, start, direction, max_cylinder: run_look(requests, start, direction),
+    "C-LOOK": lambda requests, start, direction, max_cylinder: run_clook(requests, start, direction, max_cylinder),
+}
+
+
+@pytest.mark.parametrize("policy", list(REFERENCE))
+def test_requests_present_at_start_match_offline_schedule(policy):
+    # With every request queued at time 0 the simulator services them in the offline order.
+    # Requests lie strictly inside the disk on both sides of the start, so the offline
+    # schedule's only extra stops are the end-of-disk visits.
+    rng = random.Random(0)
+    for _ in range(200):
+        max_cylinder = 199
+        start = rng.randint(20, 180)
+        direction = rng.choice(("right", "left"))
+        requests = [rng.randint(1, start - 1) for _ in range(rng.randint(1, 10))]
+        requests += [rng.randint(start + 1, max_cylinder - 1) for _ in range(rng.randint(1, 10))]
+        rng.shuffle(requests)
+        sequence, movement = REFERENCE[policy](requests, start, direction, max_cylinder)
+        served, moved = simulate([(0, r) for r in requests], start, direction, max_cylinder, policy)
+        assert [cylinder for cylinder, _, _ in served] == [r for r in sequence if r not in (0, max_cylinder)]
+        assert moved == movement
+        assert [done for _, _, done in served] == sorted(done for _, _, done in served)
+
+
+def test_arrival_ahead_of_the_head_is_picked_up_mid_sweep():
+    served, movement = simulate([(0, 100), (10, 50)], 0, 'right', 199, "LOOK")
+    assert served == [(50, 10, 50), (100, 0, 100)]
+    assert movement == 100
+
+
+def test_head_idles_until_the_next_arrival():
+    served, movement = simulate([(5, 20), (100, 10)], 0, 'right', 199, "LOOK", speed=2, service_time=1)
+    assert served == [(20, 5, 16), (10, 100, 106)]
+    assert movement == 30
+
+
+def test_sstf_with_everything_queued_matches_offline_sstf():
+    rng = random.Random(1)
+    for _ in range(200):
+        requests = [rng.randint(0, 99) for _ in range(rng.randint(1, 20))]
+        start = rng.randint(0, 99)
+        direction = rng.choice(("right", "left"))
+        sequence, movement = run_sstf(requests, start, direction)
+        served, moved = simulate([(0, r) for r in requests], start, direction, 99, "SSTF")
+        assert [cylinder for cylinder, _, _ in served] == sequence
+        assert moved == movement
+
+
+def test_nstep_scan_sweeps_batches_in_arrival_order():
+    served, movement = simulate([(0, 50), (0, 10), (0, 90)], 40, 'right', 99, "N-step SCAN", n=2)
+    assert [cylinder for cylinder, _, _ in served] == [50, 10, 90]
+    assert movement == run_nstep_scan([50, 10, 90], 40, 'right', 99, n=2)[1] == 248
+
+
+def test_fscan_holds_new_arrivals_until_the_next_sweep():
+    arrivals = [(0, 50), (0, 10), (30, 45)]
+    scan, _ = simulate(arrivals, 40, 'right', 99, "SCAN")
+    fscan, _ = simulate(arrivals, 40, 'right', 99, "FSCAN")
+    assert [cylinder for cylinder, _, _ in scan] == [50, 45, 10]     # Picked up on the way down
+    assert [cylinder for cylinder, _, _ in fscan] == [50, 10, 45]    # Frozen out of the first sweep
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        simulate([(0, 1)], 0, 'right', 10, "ELEVATOR")
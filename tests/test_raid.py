@@ -0,0 +1,88 @@
+import numpy as np                  # Import NumPy for the expected layouts
+import pytest                       # Import pytest for expected errors
+import raid                         # Module whose schedule() the test counts
+from raid import ArrayLayout, disk_max_cylinder, map_requests, simulate_array, simulate_arrays, split_requests
+from registry import run
+from result import schedule
+from timing import algorithm_timing
+
+
+def test_raid0_stripes_round_robin():
+    disks, cylinders = map_requests(np.arange(12), ArrayLayout("RAID0", 3, 2))
+    assert disks.tolist() == [0, 0, 1, 1, 2, 2, 0, 0, 1, 1, 2, 2]
+    assert cylinders.tolist() == [0, 1, 0, 1, 0, 1, 2, 3, 2, 3, 2, 3]
+
+
+def test_raid1_reads_alternate_and_writes_mirror():
+    layout = ArrayLayout("RAID1", 2, 8)
+    disks, cylinders = map_requests([7, 9, 11], layout)
+    assert disks.tolist() == [0, 1, 0] and cylinders.tolist() == [7, 9, 11]
+    disks, cylinders = map_requests([7, 9], layout, writes=True)
+    assert disks.tolist() == [0, 1, 0, 1] and cylinders.tolist() == [7, 7, 9, 9]
+
+
+def test_raid5_rotates_parity_and_adds_parity_writes():
+    layout = ArrayLayout("RAID5", 3, 1)
+    disks, cylinders = map_requests(np.arange(6), layout)
+    # Row r keeps parity on disk 2 - r % 3; its two data strips follow the parity disk
+    assert disks.tolist() == [0, 1, 2, 0, 1, 2]
+    assert cylinders.tolist() == [0, 0, 1, 1, 2, 2]
+    parity = 2 - cylinders % 3
+    assert not np.any(disks == parity)
+    disks, cylinders = map_requests([0, 3], layout, writes=True)
+    assert disks.tolist() == [0, 2, 0, 1] and cylinders.tolist() == [0, 0, 1, 1]
+
+
+def test_layout_checks():
+    with pytest.raises(ValueError):
+        map_requests([1], ArrayLayout("RAID6", 4, 8))
+    with pytest.raises(ValueError):
+        map_requests([1], ArrayLayout("RAID5", 2, 8))
+    with pytest.raises(ValueError):
+        map_requests([1], ArrayLayout("RAID0", 2, 0))
+
+
+def test_disk_size_and_queues():
+    assert disk_max_cylinder(ArrayLayout("RAID1", 2, 8), 999) == 999
+    assert disk_max_cylinder(ArrayLayout("RAID0", 4, 8), 999) == 255        # 1000 / 4 rounded up to strips
+    assert disk_max_cylinder(ArrayLayout("RAID5", 3, 8), 999) == 503        # Two data strips per row
+    queues = split_requests([5, 0, 9, 1, 8], ArrayLayout("RAID0", 2, 4))
+    # Physical cylinders per disk, each queue in arrival order (9 and 8 land in the second row)
+    assert [q.tolist() for q in queues] == [[0, 5, 1, 4], [1]]
+
+
+def test_simulation_totals_match_per_disk_runs():
+    requests = np.random.default_rng(0).integers(0, 1000, 400)
+    layout = ArrayLayout("RAID5", 4, 8)
+    serial = simulate_arrays(requests, 500, 'right', 999, ["SCAN", "SSTF"], layout, workers=1)
+    pooled = simulate_arrays(requests, 500, 'right', 999, ["SCAN", "SSTF"], layout, workers=2)
+    assert serial == pooled
+    disk_max = disk_max_cylinder(layout, 999)
+    disk_start = 500 * (disk_max + 1) // 1000
+    for algorithm, report in serial.items():
+        queues = split_requests(requests, layout)
+        expected = [run(algorithm, q.tolist(), disk_start, 'right', disk_max)[1] if q.size else 0 for q in queues]
+        assert [d["movement"] for d in report["disks"]] == expected
+        assert report["total_movement"] == sum(expected)
+        assert report["makespan_ms"] == max(d["makespan_ms"] for d in report["disks"])
+        assert sum(d["requests"] for d in report["disks"]) == requests.size
+        assert report["load_imbalance"] >= 1.0
+    assert simulate_array(requests, 500, 'right', 999, "SCAN", layout, workers=1) == serial["SCAN"]
+
+
+def test_each_disk_is_scheduled_once(monkeypatch):
+    calls = []
+
+    def counting_schedule(*args):
+        calls.append(args[0])
+        return schedule(*args)
+    monkeypatch.setattr(raid, "schedule", counting_schedule)
+    requests = np.arange(0, 1000, 7)
+    layout = ArrayLayout("RAID0", 3, 8)
+    report = simulate_array(requests, 500, 'right', 999, "C-LOOK", layout, workers=1)
+    assert calls == ["C-LOOK"] * 3
+    disk_max = disk_max_cylinder(layout, 999)
+    disk_start = 500 * (disk_max + 1) // 1000
+    for queue, disk in zip(split_requests(requests, layout), report["disks"]):
+        timing = algorithm_timing(queue, disk_start, 'right', disk_max, "C-LOOK")
+        assert disk["makespan_ms"] == timing["makespan_ms"]
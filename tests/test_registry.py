@@ -0,0 +1,42 @@
+import pytest                       # Import pytest for expected errors
+import registry                     # Algorithm registry (REGISTRY is patched below)
+from registry import KEY_FEATURES, get, names, register, run
+from nstep_scan import run_nstep_scan
+from fscan import run_fscan
+
+
+def test_builtin_algorithms_in_display_order():
+    assert names() == ["SCAN", "C-SCAN", "LOOK", "C-LOOK", "SSTF", "N-step SCAN", "FSCAN"]
+    for name in names():
+        assert len(get(name).traits) == len(KEY_FEATURES)
+    assert [name for name in names() if get(name).circular] == ["C-SCAN", "C-LOOK"]
+
+
+def test_run_drops_max_cylinder_for_algorithms_that_ignore_it():
+    assert run("LOOK", [10, 90], 50, 'right', 99) == ([90, 10], 120)
+    assert run("SCAN", [10, 90], 50, 'right', 99) == ([90, 99, 10], 138)
+
+
+def test_register_and_reject(monkeypatch):
+    monkeypatch.setattr(registry, "REGISTRY", dict(registry.REGISTRY))
+    fifo = lambda requests, start, direction: (list(requests), sum(
+        abs(b - a) for a, b in zip([start] + list(requests), requests)))
+    register("FIFO", fifo, "#000000", "First come, first served", uses_max_cylinder=False)
+    assert names()[-1] == "FIFO"
+    assert run("FIFO", [30, 10], 0, 'right', 99) == ([30, 10], 50)
+    with pytest.raises(ValueError):
+        get("ELEVATOR")
+    with pytest.raises(ValueError):
+        register("BAD", fifo, "#000000", "Missing traits", traits=["only one"])
+
+
+def test_nstep_scan_sweeps_each_batch_from_where_the_last_ended():
+    # One request per batch: up to 199, down via 150 to the end, then back up to 120 and on
+    assert run_nstep_scan([199, 150, 120], 100, 'right', 199, n=1) == ([199, 150, 0, 120, 199], 497)
+    assert run_nstep_scan([], 5, 'left', 9) == ([], 0)
+
+
+def test_fscan_freezes_the_initial_queue():
+    # [60, 20] is swept first (right from 50: 60, end, 20); [55] waits for the next sweep
+    assert run_fscan([60, 20, 55], 50, 'right', 99, initial=2) == ([60, 99, 20, 0, 55], 10 + 39 + 79 + 20 + 55)
+    assert run_fscan([60, 20, 55], 50, 'right', 99) == run_fscan([60, 20, 55], 50, 'right', 99, initial=2)
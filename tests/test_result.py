@@ -0,0 +1,55 @@
+import numpy as np                  # Import NumPy for buffer checks
+from result import ScheduleResult, schedule, schedule_all
+from cache import schedule_size     # Cache sizing reads the buffer size
+from timing import algorithm_timing
+
+
+def test_result_unpacks_like_the_run_functions():
+    result = schedule("SCAN", [20, 150, 80], 100, 'right', 199)
+    sequence, movement = result
+    assert sequence.tolist() == [150, 199, 80, 20] and movement == 278
+    assert result.tolist() == [150, 199, 80, 20] and all(type(c) is int for c in result.tolist())
+    assert result.size == 4 and result.positions.tolist() == [100, 150, 199, 80, 20]
+    assert np.shares_memory(result.sequence, result.positions)          # A view, not a copy
+    assert "SCAN" in repr(result)
+
+
+def test_compact_buffer_and_markers():
+    result = schedule("C-SCAN", [20, 150, 80], 100, 'right', 199)
+    assert result.positions.dtype == np.int32
+    assert result.tolist() == [150, 199, 0, 20, 80]
+    assert result.end_visits.tolist() == [1, 2]
+    assert result.wraps.tolist() == [2]
+    assert result.is_request.tolist() == [True, False, False, True, True]
+    assert result.is_wrap.tolist() == [False, False, True, False, False]
+    assert result.reversals.size == 0                                    # A wrap is not a reversal
+    assert schedule("LOOK", [20, 150, 80], 100, 'right', 199).reversals.tolist() == [1]
+    assert result.nbytes == result.positions.nbytes + 8 * 3
+    assert schedule_size(result) == result.nbytes
+    assert schedule_size({"C-SCAN": result}) == result.nbytes
+
+
+def test_schedule_all_subset_and_masks_feed_timing():
+    results = schedule_all([20, 150, 80], 100, 'left', 199, ["SSTF", "C-LOOK"])
+    assert list(results) == ["SSTF", "C-LOOK"]
+    assert isinstance(results["SSTF"], ScheduleResult)
+    for name, result in results.items():
+        recomputed = algorithm_timing([20, 150, 80], 100, 'left', 199, name)
+        reused = algorithm_timing([20, 150, 80], 100, 'left', 199, name, result=result)
+        assert reused["makespan_ms"] == recomputed["makespan_ms"]
+
+
+def test_buffer_widens_for_positions_beyond_int32():
+    # LOOK and SSTF never consult max_cylinder, so the dtype must come from the positions
+    for name in ("LOOK", "SSTF"):
+        result = schedule(name, [2 ** 31 + 5, 10], 0, 'right', 99)
+        assert result.positions.dtype == np.int64 and result.tolist() == [10, 2 ** 31 + 5]
+
+
+def test_batched_scan_markers_come_from_the_sweeps():
+    # FSCAN sweeps [199, 150] then [120, 199]: both 199s are requests, only the run to 0 is not
+    result = schedule("FSCAN", [199, 150, 120, 199], 100, 'right', 199)
+    assert result.tolist() == [150, 199, 199, 120, 0] and result.movement == 298
+    assert result.end_visits.tolist() == [4]
+    # Algorithms that never consult max_cylinder stop only at requests
+    assert schedule("SSTF", [199, 0, 120], 100, 'right', 199).end_visits.size == 0
@@ -0,0 +1,116 @@
+import asyncio                      # Import asyncio to drive the service
+import json                         # Import json to build request bodies
+import pytest                       # Import pytest for expected errors
+from registry import names, run
+from service import SimulationService, _http, load, parse_job
+
+
+def body(**fields):
+    return json.dumps({"requests": [10, 90, 40], "start": 50, "max_cylinder": 99, **fields}).encode()
+
+
+def test_parse_job_defaults():
+    requests, start, direction, max_cylinder, algorithms, include_sequence, profile = parse_job(body())
+    assert requests.tolist() == [10, 90, 40] and requests.dtype.kind == "i"
+    assert (start, direction, max_cylinder) == (50, "right", 99)
+    assert algorithms == tuple(names()) and include_sequence is True and profile is False
+    assert parse_job(body(profile=True))[6] is True
+    assert parse_job(body(algorithm="SSTF", direction="left"))[4] == ("SSTF",)
+    assert parse_job(body(requests=[]))[0].size == 0
+
+
+@pytest.mark.parametrize("raw", [
+    b"not json",
+    b'{"start": 1, "max_cylinder": 9}',
+    body(requests=[1.5, 2]),
+    body(requests=[[1, 2]]),
+    body(requests="12"),
+    body(direction="up"),
+    body(algorithm="ELEVATOR"),
+    body(start=100),
+    body(requests=[5, 100]),
+    body(requests=[-1]),
+])
+def test_parse_job_rejects_bad_bodies(raw):
+    with pytest.raises(ValueError):
+        parse_job(raw)
+
+
+async def _with_service(check, **options):
+    service = SimulationService(workers=1, **options)
+    server = await service.start(port=0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        return await check(service, port)
+    finally:
+        server.close()
+        await server.wait_closed()
+        service.close()
+
+
+def test_identical_jobs_are_coalesced_then_cached():
+    async def check(service, port):
+        requests = [10, 90, 40]
+        calls = [service.schedule(requests, 50, "right", 99, ("SCAN", "LOOK")) for _ in range(5)]
+        for results, metrics in await asyncio.gather(*calls):
+            assert metrics is None
+            for name, result in results.items():
+                assert (result.tolist(), result.movement) == run(name, requests, 50, "right", 99)
+        assert service.counters["computed"] == 1 and service.counters["coalesced"] == 4
+        await service.schedule(requests, 50, "right", 99, ("SCAN",))
+        assert service.counters["cache_hits"] == 1 and service.counters["computed"] == 1
+    asyncio.run(_with_service(check, max_delay_ms=50))
+
+
+def test_http_routes():
+    async def check(service, port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            assert await _http(reader, writer, "GET", "/health") == (200, {"status": "ok"})
+            assert (await _http(reader, writer, "GET", "/nope"))[0] == 404
+            assert (await _http(reader, writer, "GET", "/schedule"))[0] == 405
+            status, payload = await _http(reader, writer, "POST", "/schedule", {"requests": [5], "start": 0})
+            assert status == 400 and "error" in payload
+            job = {"requests": [10, 90, 40], "start": 50, "max_cylinder": 99, "algorithm": "C-LOOK"}
+            status, payload = await _http(reader, writer, "POST", "/schedule", job)
+            assert status == 200
+            assert payload == {"C-LOOK": {"movement": 150, "sequence": [90, 10, 40]}}
+            status, metrics = await _http(reader, writer, "GET", "/metrics")
+            assert metrics["requests"] == 2 and metrics["errors"] == 1
+            job = dict(job, requests=[11, 91, 41], profile=True, include_sequence=False)
+            status, payload = await _http(reader, writer, "POST", "/schedule", job)
+            assert status == 200 and payload["C-LOOK"] == {"movement": 151}
+            profile = payload["profile"]
+            assert profile["counters"]["C-LOOK"]["wrap_jumps"] == 1
+            assert "compute.service" in profile["phases"]
+            status, payload = await _http(reader, writer, "POST", "/schedule", job)
+            assert payload["profile"] == {"cached": True}
+        finally:
+            writer.close()
+            await writer.wait_closed()
+    asyncio.run(_with_service(check))
+
+
+def test_load_generator_reports_no_failures():
+    async def check(service, port):
+        return await load("127.0.0.1", port, clients=4, calls=5, size=50, distinct=3, max_cylinder=999)
+    report = asyncio.run(_with_service(check))
+    assert report["calls"] == 20 and report["failures"] == 0
+    assert report["server"]["requests"] == 20
+
+
+def test_failed_job_returns_500_and_keeps_the_connection():
+    async def check(service, port):
+        async def broken(*args):
+            raise RuntimeError("worker died")
+        service.schedule = broken
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            status, payload = await _http(reader, writer, "POST", "/schedule", json.loads(body()))
+            assert status == 500 and "worker died" in payload["error"]
+            assert (await _http(reader, writer, "GET", "/health"))[0] == 200
+            assert service.counters["errors"] == 1
+        finally:
+            writer.close()
+            await writer.wait_closed()
+    asyncio.run(_with_service(check))
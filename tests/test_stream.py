@@ -0,0 +1,35 @@
+import numpy as np                  # Import NumPy to write binary traces
+from scan import run_scan           # Reference SCAN implementation
+from stream import collect_schedule, open_trace, stream_schedule, write_schedule
+
+
+def test_stream_from_trace_path_with_scratch_sort(tmp_path):
+    requests = np.random.default_rng(0).integers(0, 1000, 5000)
+    trace = tmp_path / "trace.bin"
+    requests.astype(np.int64).tofile(trace)
+    expected = run_scan(requests.tolist(), 500, 'left', 999)
+    assert open_trace(trace).tolist() == requests.tolist()
+
+    stream = stream_schedule(str(trace), 500, 'left', 999, "SCAN", scratch=tmp_path / "sorted.bin", chunk_size=256)
+    assert collect_schedule(stream) == expected
+
+
+def test_stream_is_lazy_and_cumulative():
+    stream = stream_schedule([40, 10, 30], 20, 'right', 50, "SCAN")
+    assert next(stream) == (30, 10)
+    assert list(stream) == [(40, 20), (50, 30), (10, 70)]
+
+
+def test_write_schedule_round_trips(tmp_path):
+    out = tmp_path / "schedule.bin"
+    movement = write_schedule(stream_schedule([5, 90, 17, 60], 50, 'left', 99, "C-LOOK"), out, chunk_size=2)
+    expected_sequence, expected_movement = collect_schedule(stream_schedule([5, 90, 17, 60], 50, 'left', 99, "C-LOOK"))
+    assert movement == expected_movement
+    assert np.fromfile(out, dtype=np.int64).tolist() == expected_sequence
+
+
+def test_stream_reads_int32_trace_path(tmp_path):
+    trace = tmp_path / "trace32.bin"
+    np.array([40, 10, 30], dtype=np.int32).tofile(trace)
+    stream = stream_schedule(str(trace), 20, 'right', 50, "SCAN", dtype=np.int32)
+    assert collect_schedule(stream) == run_scan([40, 10, 30], 20, 'right', 50)
@@ -0,0 +1,37 @@
+import random                       # Import random for the randomized workloads
+import numpy as np                  # Import NumPy for the grid
+import pytest                       # Import pytest for parametrized cases
+from movement import movement_only  # Closed-form movement of a single configuration
+from sweep import ALGORITHMS, DIRECTIONS, sweep
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_sweep_matches_movement_only(seed):
+    rng = random.Random(seed)
+    requests = np.array([rng.randint(0, 60) for _ in range(rng.randint(1, 40))], dtype=np.int64)
+    starts = np.arange(0, 70)
+    max_cylinders = [40, int(requests.max()), 60, 75]
+    grid = sweep(requests, starts, max_cylinders, workers=1, chunk_size=16)
+    assert grid.shape == (len(ALGORITHMS), starts.size, len(DIRECTIONS), len(max_cylinders))
+    for a, algorithm in enumerate(ALGORITHMS):
+        for s, start in enumerate(starts.tolist()):
+            for d, direction in enumerate(DIRECTIONS):
+                for m, max_cylinder in enumerate(max_cylinders):
+                    if start > max_cylinder or requests.max() > max_cylinder:
+                        assert grid[a, s, d, m] == -1
+                    else:
+                        expected = movement_only(requests, start, direction, max_cylinder, algorithm)
+                        assert grid[a, s, d, m] == expected, (algorithm, start, direction, max_cylinder)
+
+
+def test_process_pool_matches_in_process():
+    requests = np.random.default_rng(1).integers(0, 500, 300)
+    serial = sweep(requests, max_cylinders=[499, 600], workers=1, chunk_size=64)
+    pooled = sweep(requests, max_cylinders=[499, 600], workers=2, chunk_size=64)
+    assert serial.shape == (len(ALGORITHMS), 601, len(DIRECTIONS), 2)
+    assert np.array_equal(serial, pooled)
+
+
+def test_empty_inputs():
+    assert sweep([], starts=[0, 5], max_cylinders=[10], workers=1).shape == (len(ALGORITHMS), 2, 2, 1)
+    assert sweep([1, 2], starts=[], max_cylinders=[10]).shape == (len(ALGORITHMS), 0, 2, 1)
@@ -0,0 +1,63 @@
+import numpy as np                  # Import NumPy for expected values
+import pytest                       # Import pytest for approximate comparisons
+from timing import (DiskModel, algorithm_timing, schedule_masks, schedule_times, seek_time,
+                    service_overhead, throughput)
+from registry import names          # Every registered algorithm
+
+MODEL = DiskModel()
+OVERHEAD = 0.5 * 60000.0 / 7200 + 4.0 / 1024.0 / 150.0 * 1000.0     # Half a turn plus 4 KB transfer
+
+
+def test_seek_curve_branches():
+    times = seek_time([0, 1, 100, 383, 1000], MODEL)
+    assert times[0] == 0.0
+    assert times[1] == pytest.approx(3.24 + 0.4)
+    assert times[2] == pytest.approx(3.24 + 0.4 * 10)
+    assert times[3] == pytest.approx(8.0 + 0.008 * 383)
+    assert times[4] == pytest.approx(8.0 + 0.008 * 1000)
+
+
+def test_schedule_times_charges_overhead_only_for_requests():
+    assert service_overhead(MODEL) == pytest.approx(OVERHEAD)
+    completion, makespan = schedule_times([100, 199, 50], 0, MODEL, is_request=[True, False, True])
+    first = 3.24 + 0.4 * 10 + OVERHEAD
+    to_end = first + 3.24 + 0.4 * np.sqrt(99)
+    assert completion == pytest.approx([first, to_end + 3.24 + 0.4 * np.sqrt(149) + OVERHEAD])
+    assert makespan == pytest.approx(completion[-1])
+    assert schedule_times([], 0, MODEL) == (pytest.approx([]), 0.0)
+
+
+def test_masks_mark_end_visits_and_wrap_jumps():
+    sequence, is_request, is_wrap = schedule_masks([20, 150, 80], 100, 'right', 199, "SCAN")
+    assert sequence.tolist() == [150, 199, 80, 20]
+    assert is_request.tolist() == [True, False, True, True] and not is_wrap.any()
+    sequence, is_request, is_wrap = schedule_masks([20, 150, 80], 100, 'right', 199, "C-SCAN")
+    assert sequence.tolist() == [150, 199, 0, 20, 80]
+    assert is_request.tolist() == [True, False, False, True, True]
+    assert is_wrap.tolist() == [False, False, True, False, False]
+
+
+def test_wrap_jump_costs_wrap_ms():
+    requests = [20, 150, 80]
+    fast = algorithm_timing(requests, 100, 'right', 199, "C-SCAN", MODEL._replace(wrap_ms=0.0))
+    slow = algorithm_timing(requests, 100, 'right', 199, "C-SCAN", MODEL._replace(wrap_ms=5.0))
+    assert slow["makespan_ms"] - fast["makespan_ms"] == pytest.approx(5.0)
+    assert fast["completion_ms"].size == len(requests)
+
+
+def test_throughput_and_summary():
+    assert throughput(10, 0.0, MODEL) == (0.0, 0.0)
+    iops, mb_s = throughput(100, 500.0, MODEL)
+    assert iops == pytest.approx(200.0) and mb_s == pytest.approx(200.0 * 4.0 / 1024.0)
+    timing = algorithm_timing([10, 90, 40], 50, 'left', 99, "LOOK")
+    assert timing["completion_ms"].size == 3
+    assert timing["mean_completion_ms"] == pytest.approx(timing["completion_ms"].mean())
+    assert timing["iops"] == pytest.approx(3 / (timing["makespan_ms"] / 1000.0))
+
+
+def test_every_registered_algorithm_is_timed():
+    requests = [120, 5, 77, 160, 33, 98]
+    for name in names():
+        timing = algorithm_timing(requests, 60, 'right', 199, name)
+        assert timing["completion_ms"].size == len(requests), name
+        assert timing["makespan_ms"] >= timing["completion_ms"].max()
@@ -0,0 +1,94 @@
+from io import BytesIO              # Import BytesIO for in-memory uploads
+import numpy as np                  # Import NumPy to build expected arrays
+import pytest                       # Import pytest for parametrized cases
+from traces import (Geometry, detect_format, load_trace, read_binary, read_blkparse, read_csv,
+                    sectors_to_cylinders, validate_requests)
+
+BLKPARSE = b"""\
+  8,0    3        1     0.000000000   697  Q   R 223490 + 8 [kjournald]
+  8,0    3        2     0.000001000   697  D   R 223490 + 8 [kjournald]
+  8,0    3        3     0.000002000   697  D   W 1024 + 8 [flush]
+  8,0    3        4     0.000003000   697  C   R 223490 + 8 [0]
+CPU3 (8,0):
+ Reads Queued:           1,        4KiB
+"""
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 2, 3, 5, 64])
+def test_csv_values_survive_chunk_boundaries(chunk_bytes):
+    data = b"12,345,6\n7890,1\n23"
+    assert read_csv(BytesIO(data), chunk_bytes=chunk_bytes).tolist() == [12, 345, 6, 7890, 1, 23]
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 4, 64])
+def test_csv_column_and_header(chunk_bytes):
+    data = b"time,cylinder\n0.5,120\n0.7,33\n0.9,4000\n"
+    values = read_csv(BytesIO(data), column=1, skip_header=True, chunk_bytes=chunk_bytes)
+    assert values.tolist() == [120, 33, 4000]
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 2, 3, 64])
+def test_csv_header_is_dropped_before_chunking(chunk_bytes):
+    # Without a column, chunks may end at commas; the whole header row must still go
+    data = b"cyl,a,b\n5,6\n7\n"
+    assert read_csv(BytesIO(data), skip_header=True, chunk_bytes=chunk_bytes).tolist() == [5, 6, 7]
+    assert read_csv(BytesIO(b"cylinder"), skip_header=True, chunk_bytes=chunk_bytes).size == 0
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 3, 64])
+def test_csv_ignores_blank_lines_trailing_commas_and_whitespace(chunk_bytes):
+    data = b"1, 2,\n\n  3\t4 ,\r\n5,\n\n"
+    assert read_csv(BytesIO(data), chunk_bytes=chunk_bytes).tolist() == [1, 2, 3, 4, 5]
+    assert read_csv(BytesIO(b" \n\n"), chunk_bytes=chunk_bytes).size == 0
+
+
+@pytest.mark.parametrize("data", [b"1,2,x\n", b"1,2.5\n", b"1;2\n"])
+def test_csv_rejects_bad_tokens(data):
+    with pytest.raises(ValueError):
+        read_csv(BytesIO(data))
+
+
+def test_csv_short_row_names_the_row():
+    with pytest.raises(ValueError, match="'0.7' has no column 1"):
+        read_csv(BytesIO(b"0.5,120\n0.7\n"), column=1)
+
+
+def test_blkparse_keeps_issued_events_only():
+    assert read_blkparse(BytesIO(BLKPARSE)).tolist() == [223490, 1024]
+    assert read_blkparse(BytesIO(BLKPARSE), actions=("Q", "C")).tolist() == [223490, 223490]
+    assert read_blkparse(BytesIO(BLKPARSE), chunk_bytes=16).tolist() == [223490, 1024]
+
+
+def test_binary_from_file_object_and_memory_mapped_path(tmp_path):
+    values = np.array([5, 9, 200], dtype=np.int32)
+    path = tmp_path / "trace.bin"
+    values.tofile(path)
+    assert read_binary(BytesIO(values.tobytes()), dtype=np.int32).tolist() == [5, 9, 200]
+    mapped = read_binary(str(path), dtype=np.int32)
+    assert isinstance(mapped, np.memmap) and mapped.tolist() == [5, 9, 200]
+
+
+def test_sector_mapping_and_validation():
+    geometry = Geometry(heads=16, sectors_per_track=63)
+    assert sectors_to_cylinders([0, 1007, 1008, 2016], geometry).tolist() == [0, 0, 1, 2]
+    validate_requests([0, 10], 10)
+    validate_requests([], 10)
+    with pytest.raises(ValueError):
+        validate_requests([-1, 3], 10)
+    with pytest.raises(ValueError):
+        validate_requests([11], 10)
+
+
+def test_load_trace_detects_format_and_maps(tmp_path):
+    assert detect_format("io.blkparse") == "blkparse"
+    assert detect_format("trace.BIN") == "binary"
+    assert detect_format("unknown.log") == "csv"
+    path = tmp_path / "sectors.csv"
+    path.write_bytes(b"0,1008\n2016\n")
+    assert load_trace(str(path), max_cylinder=2, geometry=Geometry(16, 63)).tolist() == [0, 1, 2]
+    with pytest.raises(ValueError):
+        load_trace(str(path), max_cylinder=1, geometry=Geometry(16, 63))
+    with pytest.raises(ValueError):
+        load_trace(str(path), fmt="xml")
+    path.write_bytes(b"time,sector\n0.1,1008\n0.2,2016\n")
+    assert load_trace(str(path), geometry=Geometry(16, 63), column=1, skip_header=True).tolist() == [1, 2]
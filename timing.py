@@ -0,0 +1,81 @@
+from collections import namedtuple  # Import namedtuple for the disk model parameters
+import numpy as np                  # Import NumPy for vectorized timing
+from result import schedule         # Schedules that carry their request/wrap markers
+from instrument import phase        # Opt-in phase timers
+
+# Disk timing parameters. Seeks shorter than seek_knee cylinders follow
+# short_a + short_b * sqrt(d) (acceleration-dominated); longer seeks follow
+# long_a + long_b * d (coast-dominated). Defaults are from Ruemmler & Wilkes' HP 97560 model.
+DiskModel = namedtuple("DiskModel", [
+    "seek_knee",        # Cylinder distance where the seek curve switches from sqrt to linear
+    "short_a",          # Settle/overhead time of short seeks (ms)
+    "short_b",          # sqrt(distance) coefficient of short seeks (ms)
+    "long_a",           # Overhead of long seeks (ms)
+    "long_b",           # Per-cylinder time of long seeks (ms)
+    "rpm",              # Spindle speed; rotational latency is half a revolution on average
+    "transfer_mb_s",    # Media transfer rate (MB/s)
+    "request_kb",       # Size of each request (KB)
+    "wrap_ms",          # Cost of the C-SCAN / C-LOOK return jump, which does not seek-settle
+], defaults=[383, 3.24, 0.400, 8.00, 0.008, 7200, 150.0, 4.0, 2.0])
+
+def seek_time(distance, model):
+    # Seek time in ms for an array of cylinder distances (0 for no movement)
+    distance = np.asarray(distance, dtype=np.float64)
+    short = model.short_a + model.short_b * np.sqrt(distance)
+    long = model.long_a + model.long_b * distance
+    return np.where(distance == 0, 0.0, np.where(distance < model.seek_knee, short, long))
+
+
+def service_overhead(model):
+    # Rotational latency plus transfer time of one request, in ms
+    rotation = 0.5 * 60000.0 / model.rpm
+    transfer = model.request_kb / 1024.0 / model.transfer_mb_s * 1000.0
+    return rotation + transfer
+
+
+def schedule_times(sequence, start, model, is_request=None, is_wrap=None):
+    # Turns a schedule into completion times. sequence is the list of head stops;
+    # is_request marks stops that service a request (others, e.g. end-of-disk visits,
+    # only cost a seek) and is_wrap marks steps that are wrap jumps.
+    # Returns (completion time in ms of each serviced request, makespan in ms).
+    sequence = np.asarray(sequence, dtype=np.int64)
+    steps = np.abs(np.diff(sequence, prepend=start))
+    cost = seek_time(steps, model)
+    if is_wrap is not None:
+        cost = np.where(is_wrap, model.wrap_ms, cost)
+    if is_request is None:
+        is_request = np.ones(sequence.size, dtype=bool)
+    cost = cost + np.where(is_request, service_overhead(model), 0.0)
+    elapsed = np.cumsum(cost)
+    return elapsed[is_request], float(elapsed[-1]) if elapsed.size else 0.0
+
+
+def schedule_masks(requests, start, direction, max_cylinder, algorithm, result=None):
+    # Service order plus request/wrap masks for any registered algorithm, read off its
+    # ScheduleResult. Pass the ScheduleResult already computed to avoid a rerun.
+    if result is None:
+        result = schedule(algorithm, requests, start, direction, max_cylinder)
+    return result.sequence, result.is_request, result.is_wrap
+
+
+def throughput(count, makespan_ms, model):
+    # (IOPS, MB/s) for `count` requests completed within makespan_ms
+    if makespan_ms <= 0:
+        return 0.0, 0.0
+    iops = count / (makespan_ms / 1000.0)
+    return iops, iops * model.request_kb / 1024.0
+
+
+def algorithm_timing(requests, start, direction, max_cylinder, algorithm, model=DiskModel(), result=None):
+    # Timing summary of one algorithm: per-request completion times, makespan, IOPS and MB/s
+    with phase("compute.timing"):
+        sequence, is_request, is_wrap = schedule_masks(requests, start, direction, max_cylinder, algorithm, result)
+        completion, makespan = schedule_times(sequence, start, model, is_request, is_wrap)
+        iops, mb_s = throughput(completion.size, makespan, model)
+    return {
+        "completion_ms": completion,
+        "makespan_ms": makespan,
+        "mean_completion_ms": float(completion.mean()) if completion.size else 0.0,
+        "iops": iops,
+        "mb_s": mb_s,
+    }
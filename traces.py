@@ -0,0 +1,157 @@
+import os                           # Import os for path handling
+import warnings                     # Import warnings to treat partial numeric parses as errors
+from collections import namedtuple  # Import namedtuple for the disk geometry
+import numpy as np                  # Import NumPy for fast parsing and validation
+
+# Bytes read from a trace file at a time
+CHUNK_BYTES = 1 << 22
+
+# Disk geometry used to map sector/LBA numbers to cylinders
+Geometry = namedtuple("Geometry", ["heads", "sectors_per_track"])
+
+# Trace formats understood by load_trace, keyed by file extension for auto-detection
+FORMATS = {
+    ".csv": "csv",
+    ".txt": "csv",
+    ".blktrace": "blkparse",
+    ".blkparse": "blkparse",
+    ".bin": "binary",
+    ".dat": "binary",
+}
+
+
+def _open(source):
+    # Accepts a path or an already opened binary file (e.g. a Streamlit upload)
+    if isinstance(source, (str, os.PathLike)):
+        return open(source, 'rb'), True
+    return source, False
+
+
+def _chunks(source, chunk_bytes=CHUNK_BYTES, separators=b"\n"):
+    # Yields decoded text chunks that always end on a separator, so no number is split
+    f, owned = _open(source)
+    try:
+        tail = b""
+        while True:
+            data = f.read(chunk_bytes)
+            if not data:
+                break
+            data = tail + data
+            cut = max(data.rfind(sep) for sep in separators) + 1    # Keep the unfinished tail
+            tail = data[cut:]
+            if cut:
+                yield data[:cut].decode('ascii')
+        if tail:
+            yield tail.decode('ascii')
+    finally:
+        if owned:
+            f.close()
+
+
+def _parse_numbers(text):
+    # Parses integers separated by commas and/or whitespace, rejecting anything that is not a
+    # number. Blank lines, empty fields and trailing commas are ignored.
+    text = text.replace(",", " ")
+    if not text.strip():
+        return np.empty(0, dtype=np.int64)                          # fromstring would return [0]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)          # Older NumPy only warns
+        try:
+            return np.fromstring(text, dtype=np.int64, sep=" ")     # " " matches any whitespace run
+        except (DeprecationWarning, ValueError):
+            raise ValueError("Trace contains values that are not integers") from None
+
+
+def read_csv(source, column=None, skip_header=False, chunk_bytes=CHUNK_BYTES):
+    # Reads cylinder (or sector) numbers from a CSV trace in chunks.
+    # With column=None every comma/whitespace separated value is a request; otherwise only the
+    # given zero-based column of each non-blank row is used.
+    # skip_header drops the first line before chunking, wherever the first chunk would end.
+    parts = []
+    f, owned = _open(source)
+    try:
+        if skip_header:
+            f.readline()                                            # Drop the header row
+        for text in _chunks(f, chunk_bytes, separators=(b"\n", b",", b" ", b"\t") if column is None else (b"\n",)):
+            if column is None:
+                parts.append(_parse_numbers(text))
+                continue
+            rows = []
+            for line in text.splitlines():
+                if not line.strip():
+                    continue
+                fields = line.split(",")
+                if column >= len(fields):
+                    raise ValueError(f"Trace row {line!r} has no column {column}")
+                rows.append(fields[column])
+            parts.append(np.array(rows).astype(np.int64))
+    finally:
+        if owned:
+            f.close()
+    return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+
+def read_blkparse(source, actions=("D",), chunk_bytes=CHUNK_BYTES):
+    # Reads sector numbers from blkparse text output, e.g.
+    #   8,0    3        1     0.000000000   697  D   R 223490 + 8 [kjournald]
+    # Only events whose action is in `actions` (default: issued to driver) are kept.
+    parts = []
+    for text in _chunks(source, chunk_bytes):
+        sectors = []
+        for line in text.splitlines():
+            fields = line.split()
+            # Field 5 is the action, field 7 the starting sector; skip summaries and notes
+            if len(fields) > 7 and fields[5] in actions and fields[7].isdigit():
+                sectors.append(fields[7])
+        parts.append(np.array(sectors).astype(np.int64))
+    return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+
+def read_binary(source, dtype=np.int64):
+    # Reads a raw binary array of int32/int64 values; paths are memory-mapped, not loaded
+    if isinstance(source, (str, os.PathLike)):
+        return np.memmap(source, dtype=dtype, mode='r')
+    return np.frombuffer(source.read(), dtype=dtype)
+
+
+def sectors_to_cylinders(sectors, geometry):
+    # Maps sector/LBA numbers to cylinders for the given disk geometry
+    return np.asarray(sectors, dtype=np.int64) // (geometry.heads * geometry.sectors_per_track)
+
+
+def validate_requests(requests, max_cylinder):
+    # Checks all requests lie within 0..max_cylinder; raises ValueError otherwise
+    requests = np.asarray(requests)
+    if not requests.size:
+        return
+    if requests.min() < 0:
+        raise ValueError("Negative values in disk requests!")
+    if requests.max() > max_cylinder:
+        raise ValueError(f"One or more disk requests exceed the maximum cylinder value ({max_cylinder})")
+
+
+def detect_format(name):
+    # Guesses the trace format from a file name, defaulting to CSV
+    return FORMATS.get(os.path.splitext(str(name))[1].lower(), "csv")
+
+
+def load_trace(source, max_cylinder=None, fmt="auto", geometry=None, column=None, dtype=np.int64,
+               skip_header=False):
+    # Loads, maps and (when max_cylinder is given) validates a trace in one call and returns
+    # an int64 array of cylinders. source may be a path or a binary file object.
+    # column and skip_header apply to CSV traces only.
+    if fmt == "auto":
+        fmt = detect_format(getattr(source, "name", source))
+    if fmt == "csv":
+        values = read_csv(source, column=column, skip_header=skip_header)
+    elif fmt == "blkparse":
+        values = read_blkparse(source)
+    elif fmt == "binary":
+        values = read_binary(source, dtype=dtype)
+    else:
+        raise ValueError(f"Unknown trace format: {fmt}")
+    if geometry is not None:
+        values = sectors_to_cylinders(values, geometry)
+    if max_cylinder is not None:
+        validate_requests(values, max_cylinder)
+    return values
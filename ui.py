@@ -1,23 +1,39 @@
 import streamlit as st              # Import Streamlit for building the web UI
 import plotly.subplots as sp        # Import Plotly for creating subplot layouts
 import plotly.graph_objs as go      # Import Plotly graph objects for plotting
-from scan import run_scan           # Import SCAN algorithm implementation
-from cscan import run_cscan         # Import C-SCAN algorithm implementation
-from look import run_look           # Import LOOK algorithm implementation
-from clook import run_clook         # Import C-LOOK algorithm implementation
+import numpy as np                  # Import NumPy for large-trace plotting
+from itertools import chain         # Import chain to walk start + sequence without copying
+from registry import REGISTRY, KEY_FEATURES, get, names     # Import the algorithm registry
+from result import counters, schedule, schedule_all         # Import compact schedule results
+from traces import Geometry, load_trace, validate_requests  # Import bulk trace loading and validation
+from sweep import sweep, ALGORITHMS, DIRECTIONS             # Import parallel parameter sweep
+from cache import LRUCache, make_key, schedule_size         # Import bounded result/figure cache
+from downsample import minmax_downsample                    # Import shape-preserving downsampling
+from timing import DiskModel, algorithm_timing              # Import physical seek-time model
+from analytics import analyze                               # Import per-request response-time analytics
+from raid import LAYOUTS, ArrayLayout, simulate_arrays      # Import multi-disk array simulation
+from instrument import phase, recording, timed              # Import opt-in hot-path instrumentation
+from contextlib import nullcontext                          # Import nullcontext for unrecorded runs
 
 # Dictionary mapping algorithm names to their descriptions
-ALGO_DESCRIPTIONS = {
-    "SCAN": "SCAN (Elevator): Services requests in one direction, then reverses at the end.",
-    "C-SCAN": "C-SCAN: Services requests in one direction, jumps to start after reaching end.",
-    "LOOK": "LOOK: Like SCAN, but only goes as far as the last request in each direction.",
-    "C-LOOK": "C-LOOK: Like C-SCAN, but only goes as far as the last request before jumping."
-}
+ALGO_DESCRIPTIONS = {name: algo.description for name, algo in REGISTRY.items()}
 
+# Bounded caches shared across reruns and sessions of this server process
+SCHEDULE_CACHE = LRUCache(max_entries=128, max_bytes=256 * 1024 * 1024, sizeof=schedule_size)
+FIGURE_CACHE = LRUCache(max_entries=32)
+
+# Schedules with more steps than this are drawn in large-trace mode (WebGL, downsampled)
+LARGE_TRACE_THRESHOLD = 5000
+# Maximum number of points sent to the browser per trace in large-trace mode
+MAX_PLOT_POINTS = 4000
+# Maximum number of cylinders printed in a sequence listing
+MAX_LISTED_STEPS = 2000
+
+@timed("render.tooltips")
 def get_step_explanations(sequence, start, algo_name):
     # Generates explanations/tooltips for each plotted point
     algo_desc = ALGO_DESCRIPTIONS[algo_name]                 # Get description for the algorithm
-    y_vals = [start] + sequence                             # Combine start position and request sequence
+    y_vals = chain((start,), sequence)                      # Start position followed by the request sequence
     explanations = []
     for i, y in enumerate(y_vals):
         if i == 0:
@@ -26,53 +42,201 @@ def get_step_explanations(sequence, start, algo_name):
             explanations.append(f"{algo_desc}<br>At cylinder {y} (servicing request)")  # Tooltip for requests
     return explanations
 
-def plot_all_algorithms_with_tooltips(start, scan_seq, cscan_seq, look_seq, clook_seq):
-    # Creates a 2x2 subplot comparing all four algorithms, each with tooltips
+def make_head_trace(result, color):
+    # Builds the head-movement trace for one ScheduleResult. Small schedules get SVG markers
+    # with a tooltip per point; large ones switch to WebGL, are downsampled and use one
+    # hovertemplate with the cumulative movement as compact per-point customdata.
+    # The result's position buffer (start at index 0) is plotted as is, with implicit step numbers.
+    algo_name = result.algorithm
+    positions = result.positions
+    if result.size <= LARGE_TRACE_THRESHOLD:
+        return go.Scatter(
+            x0=0, dx=1,                                             # X-axis: step numbers
+            y=positions,                                            # Y-axis: head positions
+            mode='lines+markers',                                   # Show both lines and points
+            marker=dict(size=10, color=color),                      # Marker style
+            line=dict(width=3, color=color),                        # Line style
+            text=get_step_explanations(result.sequence, result.start, algo_name),  # Tooltips
+            hoverinfo='text+y'                                      # Show tooltip and y value
+        )
+    with phase("render.downsample"):
+        moved = np.zeros(positions.size, dtype=np.int64)
+        np.cumsum(np.abs(np.diff(positions)), out=moved[1:])                # Movement so far per step
+        steps, cylinders = minmax_downsample(positions, MAX_PLOT_POINTS)
+    return go.Scattergl(
+        x=steps,
+        y=cylinders,
+        customdata=moved[steps],
+        mode='lines',
+        line=dict(width=2, color=color),
+        hovertemplate=(
+            f"{ALGO_DESCRIPTIONS[algo_name]}<br>Step %{{x}}<br>Cylinder %{{y}}"
+            "<br>Moved so far: %{customdata}<extra></extra>"
+        )
+    )
+
+def format_sequence(sequence, separator):
+    # Joins a service order for display, truncating very long schedules
+    shown = separator.join(map(str, sequence[:MAX_LISTED_STEPS]))
+    if len(sequence) > MAX_LISTED_STEPS:
+        shown += f"{separator}… ({len(sequence) - MAX_LISTED_STEPS} more)"
+    return shown
+
+@timed("render.figure")
+def plot_all_algorithms_with_tooltips(results):
+    # Creates a two-column grid of subplots comparing every algorithm, each with tooltips.
+    # results maps algorithm name to its ScheduleResult.
+    rows = (len(results) + 1) // 2
     fig = sp.make_subplots(
-        rows=2, cols=2,
-        subplot_titles=("SCAN", "C-SCAN", "LOOK", "C-LOOK"),
-        vertical_spacing=0.2, horizontal_spacing=0.13
+        rows=rows, cols=2,
+        subplot_titles=list(results),
+        vertical_spacing=0.4 / rows, horizontal_spacing=0.13
     )
 
-    # List of algorithms with their color and subplot position
-    algos = [
-        ("SCAN", scan_seq, '#2B7DE9', 1, 1),
-        ("C-SCAN", cscan_seq, '#FF4B4B', 1, 2),
-        ("LOOK", look_seq, '#2ECC71', 2, 1),
-        ("C-LOOK", clook_seq, '#E67E22', 2, 2)
-    ]
-
-    # Add a trace for each algorithm
-    for algo_name, seq, color, row, col in algos:
-        x_vals = list(range(len(seq) + 1))                          # X-axis: step numbers
-        y_vals = [start] + seq                                      # Y-axis: head positions
-        explanations = get_step_explanations(seq, start, algo_name) # Tooltips
+    # Add a trace for each algorithm, filling the grid row by row
+    for i, (algo_name, result) in enumerate(results.items()):
         fig.add_trace(
-            go.Scatter(
-                x=x_vals,
-                y=y_vals,
-                mode='lines+markers',                               # Show both lines and points
-                marker=dict(size=10, color=color),                  # Marker style
-                line=dict(width=3, color=color),                    # Line style
-                text=explanations,                                  # Tooltips
-                hoverinfo='text+y'                                  # Show tooltip and y value
-            ),
-            row=row, col=col                                        # Position in subplot
+            make_head_trace(result, get(algo_name).color),                  # Line with tooltips
+            row=i // 2 + 1, col=i % 2 + 1                                   # Position in subplot
         )
 
     # Set up layout for the full figure
     fig.update_layout(
-        height=900, width=1600,
+        height=450 * rows, width=1600,
         showlegend=False,
         plot_bgcolor="#f8f9fa",
         margin=dict(l=40, r=40, t=100, b=40)
     )
-    for i in range(1, 5):
+    for i in range(1, len(results) + 1):
         fig['layout'][f'yaxis{i}']['title'] = 'Cylinder Number'     # Y-axis label for each subplot
         fig['layout'][f'xaxis{i}']['title'] = 'Step Number'         # X-axis label for each subplot
 
     return fig
 
+@timed("render.figure")
+def plot_single_algorithm(result, color):
+    # Plots head movement for a single algorithm with tooltips
+    fig = go.Figure()
+    fig.add_trace(make_head_trace(result, color))
+    fig.update_layout(
+        title=f"{result.algorithm} ({result.direction.title()}) Head Movement",
+        xaxis_title="Step Number",
+        yaxis_title="Cylinder Number",
+        plot_bgcolor="#f8f9fa",
+        height=500, width=900,
+        margin=dict(t=80)
+    )
+    return fig
+
+@timed("render.figure")
+def plot_wait_analysis(reports):
+    # Percentile curves of per-request wait and mean wait per cylinder band for each algorithm
+    fig = sp.make_subplots(
+        rows=1, cols=2,
+        subplot_titles=("Wait Percentiles", "Mean Wait per Cylinder Band"),
+        horizontal_spacing=0.12
+    )
+    percentiles = np.arange(101)
+    for algo_name, report in reports.items():
+        waits = report["waits"]
+        curve = np.percentile(waits, percentiles) if waits.size else np.zeros(percentiles.size)
+        fig.add_trace(
+            go.Scatter(x=percentiles, y=curve, mode='lines', name=algo_name,
+                       line=dict(width=3, color=get(algo_name).color), legendgroup=algo_name),
+            row=1, col=1
+        )
+        edges = report["fairness"]["edges"]
+        labels = [f"{int(lo)}-{int(hi) - 1}" for lo, hi in zip(edges[:-1], edges[1:])]
+        fig.add_trace(
+            go.Bar(x=labels, y=report["fairness"]["mean_wait"], name=algo_name,
+                   marker_color=get(algo_name).color, legendgroup=algo_name, showlegend=False),
+            row=1, col=2
+        )
+    fig.update_xaxes(title_text="Percentile", row=1, col=1)
+    fig.update_xaxes(title_text="Cylinder Band", row=1, col=2)
+    fig.update_yaxes(title_text="Head Travel Before Service (cylinders)", row=1, col=1)
+    fig.update_layout(height=450, barmode='group', plot_bgcolor="#f8f9fa", margin=dict(l=40, r=40, t=60, b=40))
+    return fig
+
+@timed("render.figure")
+def plot_sweep_heatmap(grid, starts):
+    # Heatmap of total head movement for every algorithm and start position, one panel per direction
+    fig = sp.make_subplots(
+        rows=1, cols=len(DIRECTIONS),
+        subplot_titles=[f"Direction: {d}" for d in DIRECTIONS],
+        horizontal_spacing=0.08
+    )
+    for d, direction in enumerate(DIRECTIONS):
+        fig.add_trace(
+            go.Heatmap(
+                z=grid[:, :, d, 0],                                 # Rows: algorithms, columns: start positions
+                x=starts,
+                y=list(ALGORITHMS),
+                coloraxis="coloraxis",                              # Share one color scale across panels
+                hovertemplate="%{y}<br>Start %{x}<br>Movement %{z}<extra></extra>"
+            ),
+            row=1, col=d + 1
+        )
+        fig.update_xaxes(title_text="Initial Head Position", row=1, col=d + 1)
+    fig.update_layout(
+        height=400,
+        coloraxis=dict(colorscale="Viridis", colorbar=dict(title="Cylinders")),
+        margin=dict(l=40, r=40, t=60, b=40)
+    )
+    return fig
+
+@timed("render.figure")
+def plot_array_breakdown(reports):
+    # Per-disk busy time and head movement for each algorithm on the simulated array
+    fig = sp.make_subplots(
+        rows=1, cols=2,
+        subplot_titles=("Busy Time per Disk", "Head Movement per Disk"),
+        horizontal_spacing=0.12
+    )
+    for algo_name, report in reports.items():
+        labels = [f"Disk {i}" for i in range(len(report["disks"]))]
+        for col, field in ((1, "makespan_ms"), (2, "movement")):
+            fig.add_trace(
+                go.Bar(x=labels, y=[d[field] for d in report["disks"]], name=algo_name,
+                       marker_color=get(algo_name).color, legendgroup=algo_name, showlegend=col == 1),
+                row=1, col=col
+            )
+    fig.update_yaxes(title_text="Milliseconds", row=1, col=1)
+    fig.update_yaxes(title_text="Cylinders", row=1, col=2)
+    fig.update_layout(height=420, barmode='group', plot_bgcolor="#f8f9fa", margin=dict(l=40, r=40, t=60, b=40))
+    return fig
+
+def show_chart(fig):
+    # Sends a figure to the browser; serialization time counts as rendering
+    with phase("render.chart"):
+        st.plotly_chart(fig, use_container_width=True)
+
+def show_performance(metrics, results):
+    # Collapsible breakdown of where the run spent its time, plus per-algorithm counters
+    with st.expander("Performance"):
+        compute = metrics["categories_ms"].get("compute", 0.0)
+        render = metrics["categories_ms"].get("render", 0.0)
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Total (ms)", f"{metrics['total_ms']:.1f}")
+        col2.metric("Compute (ms)", f"{compute:.1f}")
+        col3.metric("Render (ms)", f"{render:.1f}")
+        st.caption(f"This run was {'compute' if compute >= render else 'render'}-bound. "
+                   "Results served from the cache skip their compute phases.")
+        if metrics["phases"]:
+            st.table({
+                "Phase": list(metrics["phases"]),
+                "Calls": [p["calls"] for p in metrics["phases"].values()],
+                "Wall (ms)": [f"{p['wall_ms']:.2f}" for p in metrics["phases"].values()],
+                "Net allocated blocks": [p["alloc_blocks"] for p in metrics["phases"].values()]
+            })
+        if results:
+            # Counters are read off the results' markers, so cached runs show them too
+            counts = {name: counters(result) for name, result in results.items()}
+            st.table({"Counter": list(next(iter(counts.values()))), **{
+                name: list(values.values()) for name, values in counts.items()
+            }})
+        st.json(metrics, expanded=False)
+
 def run_ui():
     # Main function to build the Streamlit UI
     st.set_page_config(
@@ -82,7 +246,36 @@ def run_ui():
     )
 
     st.title("Disk Scheduling Visualizer")              # Page title
-    st.markdown("Compare head movement patterns between **SCAN, C-SCAN, LOOK, and C-LOOK** algorithms.")
+    st.markdown(f"Compare head movement patterns between **{', '.join(names()[:-1])}, and {names()[-1]}** algorithms.")
+
+    # Sidebar controls for the result cache shared by every session
+    with st.sidebar:
+        st.markdown("### Cache")
+        if st.button("Clear cached results"):
+            SCHEDULE_CACHE.clear()                      # Explicitly drop every cached schedule
+            FIGURE_CACHE.clear()                        # ...and every cached figure
+        stats = SCHEDULE_CACHE.stats()
+        st.caption(f"{stats['entries']} schedules cached ({stats['bytes'] / 1e6:.1f} MB), "
+                   f"{len(FIGURE_CACHE)} figures cached")
+        record_performance = st.checkbox(
+            "Record performance metrics",
+            help="Times sorting, scheduling, tooltips and chart building and shows them in a Performance panel"
+        )
+
+    # Sidebar parameters of the physical disk timing model used by "Compare All"
+    with st.sidebar.expander("Disk timing model"):
+        defaults = DiskModel()
+        model = DiskModel(
+            seek_knee=st.number_input("Seek curve knee (cylinders)", min_value=1, value=defaults.seek_knee),
+            short_a=st.number_input("Short seek overhead (ms)", min_value=0.0, value=defaults.short_a),
+            short_b=st.number_input("Short seek √distance factor (ms)", min_value=0.0, value=defaults.short_b),
+            long_a=st.number_input("Long seek overhead (ms)", min_value=0.0, value=defaults.long_a),
+            long_b=st.number_input("Long seek per-cylinder (ms)", min_value=0.0, value=defaults.long_b, format="%.4f"),
+            rpm=st.number_input("Spindle speed (RPM)", min_value=1, value=defaults.rpm, step=1200),
+            transfer_mb_s=st.number_input("Transfer rate (MB/s)", min_value=0.1, value=defaults.transfer_mb_s),
+            request_kb=st.number_input("Request size (KB)", min_value=0.5, value=defaults.request_kb),
+            wrap_ms=st.number_input("Wrap jump cost (ms)", min_value=0.0, value=defaults.wrap_ms)
+        )
 
     # Input form for user parameters
     with st.form("input_form"):
@@ -119,152 +312,240 @@ def run_ui():
 
         algorithm_choice = st.radio(
             "Algorithm Selection",
-            ("SCAN", "C-SCAN", "LOOK", "C-LOOK", "Compare All"),
+            tuple(names()) + ("Compare All",),
             horizontal=True
         )
 
+        show_sweep = st.checkbox(
+            "Sweep all start positions and directions (heatmap)",
+            help="Computes every algorithm for every initial head position from 0 to the maximum cylinder"
+        )
+
+        # Optional trace input that replaces the comma-separated requests above
+        with st.expander("Load requests from a trace file"):
+            trace_file = st.file_uploader("Upload trace", type=["csv", "txt", "blktrace", "blkparse", "bin", "dat"])
+            trace_path = st.text_input("…or local trace path", value="")
+            trace_format = st.selectbox("Trace format", ("auto", "csv", "blkparse", "binary"))
+            skip_header = st.checkbox("First line is a header (CSV)")
+            map_sectors = st.checkbox("Values are sectors/LBAs (map to cylinders)")
+            gcol1, gcol2 = st.columns(2)
+            with gcol1:
+                heads = st.number_input("Heads", min_value=1, value=16, step=1)
+            with gcol2:
+                sectors_per_track = st.number_input("Sectors per track", min_value=1, value=63, step=1)
+
+        # Optional multi-disk array: the requests become addresses on a striped/mirrored volume
+        with st.expander("Simulate a disk array (RAID)"):
+            simulate_raid = st.checkbox("Split the requests across a disk array")
+            acol1, acol2, acol3 = st.columns(3)
+            with acol1:
+                raid_level = st.selectbox("Layout", LAYOUTS)
+            with acol2:
+                raid_disks = st.number_input("Disks", min_value=1, max_value=64, value=4, step=1)
+            with acol3:
+                stripe_unit = st.number_input("Stripe unit (cylinders)", min_value=1, value=8, step=1)
+            raid_writes = st.checkbox("Treat requests as writes (mirror copies / parity updates)")
+
         submitted = st.form_submit_button("Run Simulation")     # Submission button
 
     # Run simulation on submit
     if submitted:
         try:
-            requests = list(map(int, raw_requests.strip().split(',')))   # Parse request sequence
-            if any(r < 0 for r in requests):
-                st.error(" Negative values in disk requests!")         # Error for negative values
-                return
-            if any(r > max_cylinder for r in requests):                 # Prevent values exceeding max cylinder
-                st.error(f" One or more disk requests exceed the maximum cylinder value ({max_cylinder})")
-                return
-        except ValueError:
-            st.error(" Invalid input format")                         # Error for invalid input
-            return
-
-        if algorithm_choice == "Compare All":
-            with st.spinner("Calculating all algorithms..."):           # Show loading spinner
-                scan_seq, scan_move = run_scan(requests, start, direction, max_cylinder)
-                cscan_seq, cscan_move = run_cscan(requests, start, direction, max_cylinder)
-                look_seq, look_move = run_look(requests, start, direction)
-                clook_seq, clook_move = run_clook(requests, start, direction, max_cylinder)
-
-            st.subheader("Comparison Results")
-            col1, col2 = st.columns(2)
-            with col1:
-                st.metric("SCAN Total Movement", scan_move)             # Show total head movement
-                st.code(f"Sequence:\n{scan_seq}")                      # Show sequence
-                st.metric("LOOK Total Movement", look_move)
-                st.code(f"Sequence:\n{look_seq}")
-            with col2:
-                st.metric("C-SCAN Total Movement", cscan_move)
-                st.code(f"Sequence:\n{cscan_seq}")
-                st.metric("C-LOOK Total Movement", clook_move)
-                st.code(f"Sequence:\n{clook_seq}")
-
-            # Efficiency comparison
-            st.markdown("---")
-            algo_movements = {
-                "SCAN": scan_move,
-                "C-SCAN": cscan_move,
-                "LOOK": look_move,
-                "C-LOOK": clook_move
-            }
-            min_movement = min(algo_movements.values())                # Find minimum head movement
-            efficient_algos = [name for name, mov in algo_movements.items() if mov == min_movement]
-            if len(efficient_algos) == 1:
-                st.success(f" **Most Efficient:** {efficient_algos[0]} with {min_movement} cylinders")
+            if trace_file is not None or trace_path.strip():
+                geometry = Geometry(heads, sectors_per_track) if map_sectors else None
+                requests = load_trace(
+                    trace_file if trace_file is not None else trace_path.strip(),
+                    fmt=trace_format, geometry=geometry, skip_header=skip_header
+                )                                                       # Load and map the trace (int64 array)
             else:
-                st.success(f" **Tie Between:** {', '.join(efficient_algos)} with {min_movement} cylinders")
+                requests = list(map(int, raw_requests.strip().split(',')))   # Parse request sequence
+        except OSError as e:
+            st.error(f" Could not read trace: {e}")                    # Error for unreadable trace files
+            return
+        except ValueError as e:
+            st.error(f" Invalid input format: {e}")                   # Error for invalid input
+            return
+        try:
+            validate_requests(requests, max_cylinder)                   # Range check in one vectorized pass
+        except ValueError as e:
+            st.error(f" {e}")                                          # Error for negative or too large values
+            return
 
-            # --- Show Least Efficient Algorithm(s) ---
-            max_movement = max(algo_movements.values())  # Find the maximum head movement (least efficient)
-            least_efficient_algos = [name for name, mov in algo_movements.items() if mov == max_movement]
-            if len(least_efficient_algos) == 1:
-                st.error(f" **Least Efficient:** {least_efficient_algos[0]} with {max_movement} cylinders")
-            else:
-                st.error(f" **Tie Between:** {', '.join(least_efficient_algos)} with {max_movement} cylinders")
+        # Everything below is timed when performance recording is switched on in the sidebar
+        with recording() if record_performance else nullcontext() as recorder:
+            if algorithm_choice == "Compare All":
+                with st.spinner("Calculating all algorithms..."):           # Show loading spinner
+                    compare_key = make_key(requests, start, direction, max_cylinder, "Compare All")
+                    results = SCHEDULE_CACHE.get_or_compute(                  # One sort for the SCAN family
+                        compare_key,
+                        lambda: schedule_all(requests, start, direction, max_cylinder)
+                    )
 
-            # Interactive plotly visualization
-            fig = plot_all_algorithms_with_tooltips(
-                start, scan_seq, cscan_seq, look_seq, clook_seq
-            )
-            st.plotly_chart(fig, use_container_width=True)
+                st.subheader("Comparison Results")
+                columns = st.columns(2)
+                for i, (algo_name, (seq, move)) in enumerate(results.items()):
+                    with columns[i % 2]:
+                        st.metric(f"{algo_name} Total Movement", move)         # Show total head movement
+                        st.code(f"Sequence:\n[{format_sequence(seq, ', ')}]")  # Show sequence
 
-            # Show a table summarizing differences between algorithms
-            st.markdown("### Key Differences")
-            st.table({
-                "Feature": ["Direction Handling", "Return Path", "Uniform Wait Time", "Empty End Handling", "Optimal For"],
-                "SCAN": ["Reverses direction", "Services return path", "No", "Visits end always", "Moderate loads"],
-                "C-SCAN": ["Circular movement", "Jumps to start", "Yes", "Visits end always", "Heavy loads"],
-                "LOOK": ["Reverses direction", "Services return path", "No", "Visits only requested cylinders", "Moderate loads"],
-                "C-LOOK": ["Circular movement", "Jumps to start", "Yes", "Visits only requested cylinders", "Heavy loads"]
-            })
+                # Efficiency comparison
+                st.markdown("---")
+                algo_movements = {name: move for name, (_, move) in results.items()}
+                min_movement = min(algo_movements.values())                # Find minimum head movement
+                efficient_algos = [name for name, mov in algo_movements.items() if mov == min_movement]
+                if len(efficient_algos) == 1:
+                    st.success(f" **Most Efficient:** {efficient_algos[0]} with {min_movement} cylinders")
+                else:
+                    st.success(f" **Tie Between:** {', '.join(efficient_algos)} with {min_movement} cylinders")
 
-        else:
-            with st.spinner("Calculating..."):                         # Show loading spinner
-                if algorithm_choice == "SCAN":
-                    sequence, movement = run_scan(requests, start, direction, max_cylinder)
-                    algo_name = "SCAN"
-                    color = '#2B7DE9'
-                elif algorithm_choice == "C-SCAN":
-                    sequence, movement = run_cscan(requests, start, direction, max_cylinder)
-                    algo_name = "C-SCAN"
-                    color = '#FF4B4B'
-                elif algorithm_choice == "LOOK":
-                    sequence, movement = run_look(requests, start, direction)
-                    algo_name = "LOOK"
-                    color = '#2ECC71'
+                # --- Show Least Efficient Algorithm(s) ---
+                max_movement = max(algo_movements.values())  # Find the maximum head movement (least efficient)
+                least_efficient_algos = [name for name, mov in algo_movements.items() if mov == max_movement]
+                if len(least_efficient_algos) == 1:
+                    st.error(f" **Least Efficient:** {least_efficient_algos[0]} with {max_movement} cylinders")
                 else:
-                    sequence, movement = run_clook(requests, start, direction, max_cylinder)
-                    algo_name = "C-LOOK"
-                    color = '#E67E22'
-
-                st.subheader("Results")
-                st.success(f" Total head movement: **{movement}** cylinders")
-                with st.expander("Detailed Sequence", expanded=True):
-                    st.code(" → ".join(map(str, sequence)))            # Show request servicing order
-
-                # Plot result for selected algorithm
-                x_vals = list(range(len(sequence) + 1))
-                y_vals = [start] + sequence
-                explanations = get_step_explanations(sequence, start, algo_name)
-
-                fig = go.Figure()
-                fig.add_trace(go.Scatter(
-                    x=x_vals,
-                    y=y_vals,
-                    mode='lines+markers',
-                    marker=dict(size=10, color=color),
-                    line=dict(width=3, color=color),
-                    text=explanations,
-                    hoverinfo='text+y'
+                    st.error(f" **Tie Between:** {', '.join(least_efficient_algos)} with {max_movement} cylinders")
+
+                # Physical timing: seek curve, rotation, transfer and wrap-jump cost per algorithm
+                st.markdown("### Estimated Service Time")
+                timings = SCHEDULE_CACHE.get_or_compute(
+                    make_key(requests, start, direction, max_cylinder, f"Timing {tuple(model)}"),
+                    lambda: {
+                        name: algorithm_timing(requests, start, direction, max_cylinder, name, model, result)
+                        for name, result in results.items()
+                    }
+                )
+                st.table({
+                    "Algorithm": list(algo_movements),
+                    "Movement (cylinders)": list(algo_movements.values()),
+                    "Makespan (ms)": [f"{t['makespan_ms']:.1f}" for t in timings.values()],
+                    "Mean completion (ms)": [f"{t['mean_completion_ms']:.1f}" for t in timings.values()],
+                    "IOPS": [f"{t['iops']:.0f}" for t in timings.values()],
+                    "Throughput (MB/s)": [f"{t['mb_s']:.2f}" for t in timings.values()]
+                })
+                fastest = min(timings, key=lambda name: timings[name]["makespan_ms"])
+                st.info(f" **Fastest by makespan:** {fastest} in {timings[fastest]['makespan_ms']:.1f} ms")
+
+                # Per-request response time: head travel until each request is serviced
+                st.markdown("### Response Time & Starvation")
+                reports = SCHEDULE_CACHE.get_or_compute(
+                    make_key(requests, start, direction, max_cylinder, "Waits"),
+                    lambda: {
+                        name: analyze(requests, start, direction, max_cylinder, name, result=result)
+                        for name, result in results.items()
+                    }
+                )
+                st.table({
+                    "Algorithm": list(reports),
+                    "p50 (cyl)": [f"{r['stats']['p50']:.0f}" for r in reports.values()],
+                    "p95 (cyl)": [f"{r['stats']['p95']:.0f}" for r in reports.values()],
+                    "p99 (cyl)": [f"{r['stats']['p99']:.0f}" for r in reports.values()],
+                    "Max (cyl)": [f"{r['stats']['max']:.0f}" for r in reports.values()],
+                    "Std dev (cyl)": [f"{r['stats']['variance'] ** 0.5:.1f}" for r in reports.values()],
+                    "p99 (ms)": [f"{np.percentile(t['completion_ms'], 99):.1f}" if t['completion_ms'].size else "0.0"
+                                 for t in timings.values()],
+                    "Band fairness (Jain)": [f"{r['fairness']['jain_index']:.3f}" for r in reports.values()]
+                })
+                show_chart(FIGURE_CACHE.get_or_compute(
+                    make_key(requests, start, direction, max_cylinder, "Waits"),
+                    lambda: plot_wait_analysis(reports)
                 ))
-                fig.update_layout(
-                    title=f"{algo_name} ({direction.title()}) Head Movement",
-                    xaxis_title="Step Number",
-                    yaxis_title="Cylinder Number",
-                    plot_bgcolor="#f8f9fa",
-                    height=500, width=900,
-                    margin=dict(t=80)
+
+                # Interactive plotly visualization
+                fig = FIGURE_CACHE.get_or_compute(
+                    compare_key,
+                    lambda: plot_all_algorithms_with_tooltips(results)
                 )
-                st.plotly_chart(fig, use_container_width=True)
-
-                # Algorithm explanation
-                if algo_name == "SCAN":
-                    st.markdown("**SCAN Algorithm Characteristics:**")
-                    st.markdown("- Also known as the elevator algorithm")
-                    st.markdown("- Services requests in one direction until end, then reverses")
-                elif algo_name == "C-SCAN":
-                    st.markdown("**C-SCAN Algorithm Characteristics:**")
-                    st.markdown("- Circular version of SCAN")
-                    st.markdown("- Treats cylinders as a circular list")
-                    st.markdown("- Jumps back to start after reaching end")
-                elif algo_name == "LOOK":
-                    st.markdown("**LOOK Algorithm Characteristics:**")
-                    st.markdown("- Similar to SCAN but only goes as far as the last request in each direction")
-                    st.markdown("- Does not go to the end of the disk unless requested")
+                show_chart(fig)
+
+                # Show a table summarizing differences between algorithms
+                st.markdown("### Key Differences")
+                st.table({"Feature": KEY_FEATURES, **{name: list(algo.traits) for name, algo in REGISTRY.items()}})
+                array_algorithms = list(results)
+                shown_results = results
+
+            else:
+                with st.spinner("Calculating..."):                         # Show loading spinner
+                    algo_name = algorithm_choice
+                    color = get(algo_name).color
+                    compute = lambda: schedule(algo_name, requests, start, direction, max_cylinder)
+                    algo_key = make_key(requests, start, direction, max_cylinder, algo_name)
+                    result = SCHEDULE_CACHE.get_or_compute(algo_key, compute)
+                    sequence, movement = result
+
+                    st.subheader("Results")
+                    st.success(f" Total head movement: **{movement}** cylinders")
+                    with st.expander("Detailed Sequence", expanded=True):
+                        st.code(format_sequence(sequence, " → "))            # Show request servicing order
+
+                    # Plot result for selected algorithm
+                    fig = FIGURE_CACHE.get_or_compute(
+                        algo_key,
+                        lambda: plot_single_algorithm(result, color)
+                    )
+                    show_chart(fig)
+
+                    # Algorithm explanation
+                    st.markdown(f"**{algo_name} Algorithm Characteristics:**")
+                    for point in get(algo_name).characteristics:
+                        st.markdown(f"- {point}")
+                array_algorithms = [algo_name]
+                shown_results = {algo_name: result}
+
+            # Optional array simulation: every algorithm scheduled on every member disk in parallel
+            if simulate_raid:
+                layout = ArrayLayout(raid_level, raid_disks, stripe_unit)
+                try:
+                    with st.spinner("Scheduling each disk of the array..."):
+                        arrays = SCHEDULE_CACHE.get_or_compute(
+                            make_key(requests, start, direction, max_cylinder,
+                                     f"Array {tuple(layout)} {raid_writes} {tuple(model)} {array_algorithms}"),
+                            lambda: simulate_arrays(requests, start, direction, max_cylinder,
+                                                    array_algorithms, layout, raid_writes, model)
+                        )
+                except ValueError as e:
+                    st.error(f" {e}")                                      # Error for an impossible layout
                 else:
-                    st.markdown("**C-LOOK Algorithm Characteristics:**")
-                    st.markdown("- Circular version of LOOK")
-                    st.markdown("- Jumps back to the first request after reaching the last")
+                    st.markdown(f"### Disk Array ({raid_level}, {raid_disks} disks)")
+                    st.caption(f"Each disk holds cylinders 0-{next(iter(arrays.values()))['disk_max_cylinder']}; "
+                               "imbalance is the busiest disk relative to the mean (1.00 is even).")
+                    st.table({
+                        "Algorithm": list(arrays),
+                        "Total movement (cylinders)": [r["total_movement"] for r in arrays.values()],
+                        "Array makespan (ms)": [f"{r['makespan_ms']:.1f}" for r in arrays.values()],
+                        "IOPS": [f"{r['iops']:.0f}" for r in arrays.values()],
+                        "Throughput (MB/s)": [f"{r['mb_s']:.2f}" for r in arrays.values()],
+                        "Load imbalance": [f"{r['load_imbalance']:.2f}" for r in arrays.values()],
+                        "Time imbalance": [f"{r['time_imbalance']:.2f}" for r in arrays.values()]
+                    })
+                    with st.expander("Per-disk breakdown", expanded=len(arrays) == 1):
+                        for algo_name, report in arrays.items():
+                            if len(arrays) > 1:
+                                st.markdown(f"**{algo_name}**")
+                            st.table({
+                                "Disk": list(range(len(report["disks"]))),
+                                "Requests": [d["requests"] for d in report["disks"]],
+                                "Movement (cylinders)": [d["movement"] for d in report["disks"]],
+                                "Busy time (ms)": [f"{d['makespan_ms']:.1f}" for d in report["disks"]],
+                                "Mean completion (ms)": [f"{d['mean_completion_ms']:.1f}" for d in report["disks"]]
+                            })
+                    show_chart(plot_array_breakdown(arrays))
+
+            # Optional parameter sweep across every start position and both directions
+            if show_sweep:
+                with st.spinner("Sweeping start positions..."):
+                    starts = list(range(max_cylinder + 1))
+                    # The grid covers every start and direction, so neither belongs in the key.
+                    # One worker: a process pool per Streamlit rerun costs more than it saves.
+                    grid = SCHEDULE_CACHE.get_or_compute(
+                        make_key(requests, None, None, max_cylinder, "Sweep"),
+                        lambda: sweep(requests, starts=starts, max_cylinders=[max_cylinder], workers=1)
+                    )
+                st.markdown("### Parameter Sweep")
+                show_chart(plot_sweep_heatmap(grid, starts))
+
+        if recorder is not None:
+            show_performance(recorder.metrics(), shown_results)
 
 if __name__ == "__main__":
     run_ui()   # Run the UI if this file is executed directly